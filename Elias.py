@@ -53,3 +53,192 @@ def decode_elias(bitstr):
 
     return int_val
   
+
+def write_elias(writer, num):
+    """
+    This function writes the Elias omega code of num (the same bits as elias_num)
+    to a bitio.BitWriter using integer operations instead of strings.
+    :param writer: a bitio.BitWriter
+    :param num: a positive integer
+    :best and worst case: O(log* num) components written
+    :aux space complexity: O(log* num)
+    :return: None
+    """
+    if num < 1:
+        raise Exception("Elias omega needs a positive integer")
+    components = [(num, num.bit_length())]
+    n = num.bit_length() - 1
+    while n >= 1:
+        length = n.bit_length()
+        # flip the leading bit of every length component into 0
+        components.append((n ^ (1 << (length - 1)), length))
+        n = length - 1
+
+    for value, length in reversed(components):
+        writer.write(value, length)
+
+def read_elias(reader):
+    """
+    This function reads one Elias omega code written by write_elias (or elias_num)
+    from a bitio.BitReader.
+    :param reader: a bitio.BitReader
+    :best and worst case: O(log* num) components read
+    :aux space complexity: O(1)
+    :return: the decoded integer
+    """
+    length = 1
+    while True:
+        if reader.read_bit():
+            return (1 << (length - 1)) | reader.read(length - 1)
+        length = ((1 << (length - 1)) | reader.read(length - 1)) + 1
+
+# Lookup tables for encode_many/decode_many, built on first use.
+# _CODES[num] is the (code, length) pair of num for num < _CODE_LIMIT and
+# _PEEK[bits] is the (num, length) pair of the code starting the _PEEK_BITS bits,
+# or None when that code is longer than _PEEK_BITS
+_CODE_LIMIT = 1 << 16
+_PEEK_BITS = 16
+_CODES = []
+_PEEK = []
+
+def elias_code(num):
+    """
+    This function calculates the Elias omega code of num as an integer.
+    :param num: a positive integer
+    :best and worst case: O(log* num)
+    :aux space complexity: O(1)
+    :return: a tuple of the code and its length in bits
+    """
+    if num < 1:
+        raise Exception("Elias omega needs a positive integer")
+    code = num
+    length = num.bit_length()
+    n = length - 1
+    while n >= 1:
+        size = n.bit_length()
+        code |= (n ^ (1 << (size - 1))) << length
+        length += size
+        n = size - 1
+    return code, length
+
+def build_tables():
+    """
+    This function fills the _CODES and _PEEK lookup tables.
+    :best and worst case: O(2^16)
+    :aux space complexity: O(2^16)
+    :return: None
+    """
+    if _CODES:
+        return
+    _CODES.append((0, 0))
+    _CODES.extend(elias_code(num) for num in range(1, _CODE_LIMIT))
+
+    _PEEK.extend([None]*(1 << _PEEK_BITS))
+    for num in range(1, _CODE_LIMIT):
+        code, length = _CODES[num]
+        if length > _PEEK_BITS:
+            break
+        start = code << (_PEEK_BITS - length)
+        entry = (num, length)
+        for bits in range(start, start + (1 << (_PEEK_BITS - length))):
+            _PEEK[bits] = entry
+
+def encode_many(ints):
+    """
+    This function encodes a sequence of positive integers as one packed buffer of
+    Elias omega codes. The buffer starts with the code of len(ints) + 1 and the
+    last byte is padded with 0 bits. Codes of numbers below 2^16 come from a lookup
+    table and pending bits are kept in an integer accumulator that is flushed to a
+    bytearray every few hundred bits.
+    :param ints: an iterable of positive integers
+    :best and worst case: O(N) with N as the number of integers
+    :aux space complexity: O(1) besides the output
+    :space complexity: O(N)
+    :return: the packed codes as bytes
+    """
+    if not hasattr(ints, "__len__"):
+        ints = list(ints)
+    build_tables()
+    codes = _CODES
+    limit = _CODE_LIMIT
+
+    out = bytearray()
+    acc, bits = elias_code(len(ints) + 1)
+
+    for num in ints:
+        if 0 < num < limit:
+            code, length = codes[num]
+        else:
+            code, length = elias_code(num)
+        acc = (acc << length) | code
+        bits += length
+        if bits >= 512:
+            rest = bits & 7
+            out += (acc >> rest).to_bytes(bits >> 3, "big")
+            acc &= (1 << rest) - 1
+            bits = rest
+
+    if bits:
+        pad = -bits & 7
+        out += (acc << pad).to_bytes((bits + pad) >> 3, "big")
+    return bytes(out)
+
+def decode_many(buf):
+    """
+    A generator that decodes a buffer produced by encode_many. Bits are loaded
+    8 bytes at a time into an integer accumulator, and any code that fits in
+    16 bits is decoded with a single table lookup. Longer codes are read
+    component by component.
+    :param buf: a bytes-like object
+    :best and worst case: O(N) with N as the number of integers
+    :aux space complexity: O(1)
+    :return: an iterator over the decoded integers
+    """
+    build_tables()
+    peek_table = _PEEK
+    peek_bits = _PEEK_BITS
+    peek_mask = (1 << peek_bits) - 1
+
+    buf = bytes(buf) + bytes(8)
+    total = (len(buf) - 8)*8
+    pos = 0      # next byte to load
+    acc = 0
+    bits = 0     # bits loaded but not consumed
+    used = 0     # bits consumed
+    count = None
+
+    while count is None or count > 0:
+        if bits < 64:
+            acc = ((acc & ((1 << bits) - 1)) << 64) | int.from_bytes(buf[pos:pos + 8], "big")
+            pos += 8
+            bits += 64
+
+        entry = peek_table[(acc >> (bits - peek_bits)) & peek_mask]
+        if entry is not None:
+            num, length = entry
+            bits -= length
+            used += length
+        else:
+            length = 1
+            while True:
+                while bits < length:
+                    acc = ((acc & ((1 << bits) - 1)) << 64) | int.from_bytes(buf[pos:pos + 8], "big")
+                    pos += 8
+                    bits += 64
+                    if pos > len(buf):
+                        raise Exception("Truncated Elias stream")
+                bits -= length
+                used += length
+                component = (acc >> bits) & ((1 << length) - 1)
+                if component >> (length - 1):
+                    num = component
+                    break
+                length = (component | (1 << (length - 1))) + 1
+
+        if used > total:
+            raise Exception("Truncated Elias stream")
+        if count is None:
+            count = num - 1
+        else:
+            count -= 1
+            yield num
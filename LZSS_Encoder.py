@@ -0,0 +1,350 @@
+"""
+@created 19 October 2026
+
+LZSS encoder producing the (1, char) / (0, offset, length) tokens understood by
+LZZS_Decoder. Matches are found with a hash chain over a sliding window: the
+most recent position of every 3 character prefix is kept in a table and each
+position links back to the previous one with the same prefix.
+"""
+import time
+
+from Ukkonen import build_lcp_array, build_suffix_array, previous_factors
+
+MIN_MATCH = 3
+
+# level: (window size, maximum match length, chain depth, lazy matching, insert limit)
+# insert limit is the longest match whose inner positions are still added to the chains
+LEVELS = {
+    1: (4096, 18, 4, False, 4),
+    2: (8192, 34, 8, False, 8),
+    3: (8192, 66, 16, False, 16),
+    4: (16384, 130, 16, True, 32),
+    5: (32768, 258, 32, True, 64),
+    6: (32768, 258, 64, True, 258),
+    7: (32768, 258, 128, True, 258),
+    8: (65536, 258, 512, True, 258),
+    9: (65536, 258, 4096, True, 258),
+}
+
+class HashChain:
+    """
+    This class implements a hash chain match finder over a sliding window. head
+    maps a 3 character prefix to its most recent position and prev[pos & mask]
+    stores the previous position with the same prefix, so prev is a ring buffer
+    of the window size.
+    """
+    def __init__(self, data, window, max_len, chain):
+        """
+        Construction function that initialises instances of class HashChain.
+        Window is rounded up to a power of two so that the ring buffer can be
+        indexed with a mask.
+        """
+        size = 1
+        while size < window:
+            size <<= 1
+
+        self.data = data
+        self.size = len(data)
+        self.window = window
+        self.mask = size - 1
+        self.max_len = max_len
+        self.chain = chain
+        self.head = {}
+        self.prev = [-1]*size
+
+    def insert(self, pos):
+        """
+        This function adds pos to the chain of its 3 character prefix
+        :param pos: the position to be inserted
+        :Best and worst case: O(1)
+        :Aux space complexity: O(1)
+        :return: None
+        """
+        if pos + MIN_MATCH <= self.size:
+            key = self.data[pos:pos + MIN_MATCH]
+            self.prev[pos & self.mask] = self.head.get(key, -1)
+            self.head[key] = pos
+
+    def match_length(self, cand, pos, limit):
+        """
+        This function counts how many characters starting at cand and pos agree.
+        The comparison is done on chunks of 32 characters through slices before
+        falling back to single characters.
+        :param cand: an earlier position
+        :param pos: the current position
+        :param limit: the maximum length to compare
+        :Best case: O(1) when the first characters differ
+        :Worst case: O(limit)
+        :Aux space complexity: O(1)
+        :return length: the length of the common prefix
+        """
+        data = self.data
+        length = 0
+        while length + 32 <= limit and data[cand + length:cand + length + 32] == data[pos + length:pos + length + 32]:
+            length += 32
+        while length < limit and data[cand + length] == data[pos + length]:
+            length += 1
+        return length
+
+    def find(self, pos):
+        """
+        This function walks the chain of pos to find the longest match in the window
+        :param pos: the current position
+        :Best case: O(1) when the prefix has not been seen before
+        :Worst case: O(chain * max_len)
+        :Aux space complexity: O(1)
+        :return: a tuple of the match length and the offset (0, 0 when no match)
+        """
+        limit = min(self.max_len, self.size - pos)
+        if limit < MIN_MATCH:
+            return 0, 0
+
+        data = self.data
+        best_len = MIN_MATCH - 1
+        best_off = 0
+        lowest = pos - self.window
+        cand = self.head.get(data[pos:pos + MIN_MATCH], -1)
+        depth = self.chain
+
+        while cand > lowest and cand >= 0 and depth > 0:
+            # only compare when the candidate can beat the current best
+            if data[cand + best_len] == data[pos + best_len]:
+                length = self.match_length(cand, pos, limit)
+                if length > best_len:
+                    best_len = length
+                    best_off = pos - cand
+                    if length == limit:
+                        break
+            cand = self.prev[cand & self.mask]
+            depth -= 1
+
+        if best_off == 0:
+            return 0, 0
+        return best_len, best_off
+
+def encode_lzss(data, level=6, window=None, max_len=None, chain=None):
+    """
+    This function encodes data with LZSS. The level selects a preset from LEVELS
+    trading speed for ratio; window, max_len and chain override the preset.
+    Levels from 4 onwards use lazy matching: a match is deferred by one position
+    when the next position has a longer one.
+    :param data: a string or bytes to be encoded
+    :param level: compression level from 1 (fastest) to 9 (smallest)
+    :param window: the maximum back-reference offset, None for the preset
+    :param max_len: the maximum match length, None for the preset
+    :param chain: the maximum number of chain links followed per position, None for
+    the preset
+    :Best case: O(N) with N as the length of data
+    :Worst case: O(N * chain * max_len)
+    :Aux space complexity: O(window + D) with D as the number of distinct 3 character prefixes
+    :Space complexity: O(N)
+    :return to_return: a list of (1, char) and (0, offset, length) tuples. char is a
+    single character for strings and an integer for bytes
+    """
+    if level not in LEVELS:
+        raise Exception("Level must be between 1 and 9")
+    preset_window, preset_len, preset_chain, lazy, insert_limit = LEVELS[level]
+    window = preset_window if window is None else window
+    max_len = preset_len if max_len is None else max_len
+    chain = preset_chain if chain is None else chain
+    if window < 1 or max_len < 1 or chain < 1:
+        raise Exception("Window, max_len and chain must be at least 1")
+    finder = HashChain(data, window, max_len, chain)
+
+    to_return = []
+    n = len(data)
+    i = 0
+
+    while i < n:
+        length, offset = finder.find(i)
+
+        if length and lazy and length < finder.max_len:
+            finder.insert(i)
+            next_length, next_offset = finder.find(i + 1)
+            if next_length > length:
+                # emit a literal and take the longer match at i + 1
+                to_return.append((1, data[i]))
+                i += 1
+                length, offset = next_length, next_offset
+                start = i
+            else:
+                start = i + 1
+        else:
+            start = i
+
+        if length == 0:
+            to_return.append((1, data[i]))
+            finder.insert(i)
+            i += 1
+            continue
+
+        to_return.append((0, offset, length))
+        if length <= insert_limit:
+            for pos in range(start, i + length):
+                finder.insert(pos)
+        else:
+            finder.insert(start)
+        i += length
+
+    return to_return
+
+def varint_bits(num):
+    """
+    This function calculates how many bits the varint of num takes in pack_lzss
+    :param num: a non-negative integer
+    :Best and worst case: O(log num)
+    :return: the number of bits
+    """
+    bits = 8
+    while num >= 0x80:
+        num >>= 7
+        bits += 8
+    return bits
+
+def packed_match_cost(offset, length):
+    """
+    This function is the default cost model of encode_lzss_optimal: the number of
+    bits a back-reference takes in pack_lzss (flag bit, varint offset and length)
+    :param offset: the offset of the back-reference
+    :param length: the length of the back-reference
+    :Best and worst case: O(1) for offsets and lengths that fit in a few varint bytes
+    :return: the cost in bits
+    """
+    return 1 + varint_bits(offset) + varint_bits(length)
+
+def encode_lzss_optimal(data, max_len=258, window=None, literal_cost=9, match_cost=packed_match_cost):
+    """
+    This function encodes data with LZSS using optimal parsing: instead of taking
+    the longest match at each position, it picks the sequence of tokens with the
+    smallest total cost through dynamic programming from the end of data,
+    cost[i] = min(literal_cost + cost[i+1], match_cost(offset, l) + cost[i+l]).
+
+    Candidate matches come from the suffix array and its LCP array (Ukkonen.py):
+    the closest earlier-starting suffixes before and after each position in
+    suffix array order give the longest previous match, and the other one gives
+    a second candidate that may be closer. For each candidate, the DP tries the
+    shortest lengths, the longest length and the few lengths below it, so every
+    position costs O(1) and the parse stays linear after the suffix array.
+    :param data: a string or bytes to be encoded
+    :param max_len: the maximum match length
+    :param window: the maximum back-reference offset, None for no limit
+    :param literal_cost: the cost of a literal token
+    :param match_cost: a function of (offset, length) giving the cost of a back-reference
+    :Best and worst case: O(N log^2 N) with N as the length of data for the suffix
+    array, O(N) for the parse itself
+    :Aux space complexity: O(N)
+    :Space complexity: O(N)
+    :return to_return: a list of (1, char) and (0, offset, length) tuples
+    """
+    n = len(data)
+    suffix_arr = build_suffix_array(data)
+    lcp = build_lcp_array(data, suffix_arr)
+    prev_src, prev_len, next_src, next_len = previous_factors(suffix_arr, lcp)
+    del suffix_arr, lcp
+
+    cost = [0]*(n + 1)
+    choice_len = [0]*n
+    choice_off = [0]*n
+
+    for i in range(n - 1, -1, -1):
+        best = literal_cost + cost[i + 1]
+        best_len = 0
+        best_off = 0
+
+        # keep the candidates that are within the window and not dominated
+        candidates = []
+        for src, length in ((prev_src[i], prev_len[i]), (next_src[i], next_len[i])):
+            length = min(length, max_len)
+            if src < 0 or length < MIN_MATCH:
+                continue
+            offset = i - src
+            if window is not None and offset > window:
+                continue
+            candidates.append((offset, length))
+        if len(candidates) == 2:
+            (off_a, len_a), (off_b, len_b) = candidates
+            if off_a <= off_b and len_a >= len_b:
+                candidates.pop()
+            elif off_b <= off_a and len_b >= len_a:
+                candidates.pop(0)
+
+        for offset, length in candidates:
+            lengths = set(range(MIN_MATCH, min(length, MIN_MATCH + 4) + 1))
+            lengths.update(range(max(MIN_MATCH, length - 4), length + 1))
+            for l in lengths:
+                total = match_cost(offset, l) + cost[i + l]
+                if total < best:
+                    best = total
+                    best_len = l
+                    best_off = offset
+
+        cost[i] = best
+        choice_len[i] = best_len
+        choice_off[i] = best_off
+
+    to_return = []
+    i = 0
+    while i < n:
+        if choice_len[i] == 0:
+            to_return.append((1, data[i]))
+            i += 1
+        else:
+            to_return.append((0, choice_off[i], choice_len[i]))
+            i += choice_len[i]
+
+    return to_return
+
+def benchmark_corpus():
+    """
+    This function builds the benchmark corpus from fixed seeds, so that results are
+    comparable between runs and revisions: generated Python-like source followed by
+    generated English-like text.
+    :return: the corpus as bytes
+    """
+    import random
+
+    rng = random.Random(27)
+    names = ["index", "value", "count", "node", "heap", "key", "offset", "length",
+             "buffer", "result", "parent", "weight", "vertex", "edge", "position"]
+    lines = []
+    for number in range(3000):
+        args = ", ".join(rng.sample(names, rng.randint(1, 3)))
+        lines.append("def %s_%d(%s):" % (rng.choice(names), number, args))
+        lines.append('    """')
+        lines.append("    A function to compute the %s of the %s." % (rng.choice(names), rng.choice(names)))
+        lines.append('    """')
+        for _ in range(rng.randint(2, 6)):
+            lines.append("    %s = %s %s %d" % (rng.choice(names), rng.choice(names),
+                                                rng.choice("+-*"), rng.randint(0, 99)))
+        lines.append("    return %s\n" % rng.choice(names))
+    parts = ["\n".join(lines).encode()]
+
+    rng = random.Random(26)
+    words = ["the", "of", "and", "to", "in", "is", "that", "for", "it", "as", "was",
+             "with", "be", "by", "on", "not", "he", "this", "are", "or", "his", "from",
+             "at", "which", "but", "have", "an", "had", "they", "you", "were", "their",
+             "suffix", "tree", "heap", "radix", "sort", "graph", "edge", "vertex", "queue"]
+    parts.append(" ".join(rng.choice(words) for _ in range(100000)).encode())
+    return b"".join(parts)
+
+if __name__ == "__main__":
+    from LZZS_Decoder import decode_lzss_bytes, pack_lzss
+
+    corpus = benchmark_corpus()
+    size = len(corpus)
+    print("corpus: %d bytes" % size)
+    print("level  ratio   encode MB/s  decode MB/s")
+    for level in sorted(LEVELS):
+        start = time.perf_counter()
+        tokens = encode_lzss(corpus, level)
+        encode_time = time.perf_counter() - start
+        packed = pack_lzss(tokens)
+
+        start = time.perf_counter()
+        decoded = decode_lzss_bytes(packed)
+        decode_time = time.perf_counter() - start
+        assert decoded == corpus
+
+        print("%5d  %.3f  %11.2f  %11.2f" % (level, len(packed) / size,
+                                             size / encode_time / 1e6,
+                                             size / decode_time / 1e6))
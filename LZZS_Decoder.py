@@ -28,5 +28,223 @@ def decode_lzss(code_list):
 
     return to_return
 
-lst = [(1,"a"),(1,"a"),(1,"c"),(0,3,4),(1,"b"),(0,3,3),(1,"a")]
-print(decode_lzss(lst))
+def write_varint(out, num):
+    """
+    A function to append a non-negative integer to a bytearray as an unsigned
+    LEB128 varint (7 bits per byte, high bit set on every byte but the last).
+    :param out: the bytearray to append to
+    :param num: the integer to be written
+    :best and worst case: O(log num)
+    :aux space complexity: O(1)
+    :space complexity: O(log num)
+    :return: None
+    """
+    while num >= 0x80:
+        out.append((num & 0x7f) | 0x80)
+        num >>= 7
+    out.append(num)
+
+def read_varint(buf, pos):
+    """
+    A function to read an unsigned LEB128 varint from buf starting at pos.
+    :param buf: a bytes-like object
+    :param pos: the position of the first byte of the varint
+    :best and worst case: O(log num)
+    :aux space complexity: O(1)
+    :space complexity: O(1)
+    :return: a tuple of the decoded integer and the position after the varint
+    """
+    num = 0
+    shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        num |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return num, pos
+        shift += 7
+
+def literal_byte(char):
+    """
+    A function to convert a literal of a (1, char) token into a byte value.
+    Literals can be a single character string (code point < 256), a single
+    byte or an integer in range 0-255.
+    :param char: the literal of the token
+    :best and worst case: O(1)
+    :return: an integer in range 0-255
+    """
+    if isinstance(char, int):
+        return char
+    return ord(char)
+
+def pack_lzss(code_list):
+    """
+    A function to pack LZSS tuples into a binary token stream. The stream starts
+    with the decoded length as a varint. Tokens then follow in groups of 8, each
+    group led by a flag byte whose i-th bit (LSB first) is 1 when the i-th token
+    is a literal. A literal is stored as one byte while a back-reference is
+    stored as a varint offset followed by a varint length.
+    :param code_list: a list of (1, char) and (0, offset, length) tuples
+    :best and worst case: O(T) with T as the number of tokens
+    :aux space complexity: O(T)
+    :space complexity: O(T)
+    :return: the packed stream as bytes
+    """
+    body = bytearray()
+    total = 0
+    flag_pos = 0
+    flag_bit = 8
+
+    for code in code_list:
+        if flag_bit == 8:
+            flag_pos = len(body)
+            body.append(0)
+            flag_bit = 0
+
+        if code[0] == 1:
+            body[flag_pos] |= 1 << flag_bit
+            body.append(literal_byte(code[1]))
+            total += 1
+        elif code[0] == 0:
+            write_varint(body, code[1])
+            write_varint(body, code[2])
+            total += code[2]
+        else:
+            raise Exception("Not LZSS")
+        flag_bit += 1
+
+    out = bytearray()
+    write_varint(out, total)
+    return bytes(out + body)
+
+def unpack_lzss(stream):
+    """
+    A generator that turns a packed binary token stream (see pack_lzss) back
+    into LZSS tuples. Literals are yielded as integers.
+    :param stream: a bytes-like object produced by pack_lzss
+    :best and worst case: O(S) with S as the length of the stream
+    :aux space complexity: O(1)
+    :return: an iterator over (1, byte) and (0, offset, length) tuples
+    """
+    buf = memoryview(stream)
+    try:
+        remaining, pos = read_varint(buf, 0)
+
+        while remaining > 0:
+            flags = buf[pos]
+            pos += 1
+            for bit in range(8):
+                if remaining <= 0:
+                    break
+                if flags >> bit & 1:
+                    yield (1, buf[pos])
+                    pos += 1
+                    remaining -= 1
+                else:
+                    offset, pos = read_varint(buf, pos)
+                    length, pos = read_varint(buf, pos)
+                    yield (0, offset, length)
+                    remaining -= length
+    except IndexError:
+        raise Exception("Malformed LZSS stream")
+
+def decoded_length(code_list):
+    """
+    A function to calculate the length of the output of a list of LZSS tuples.
+    :param code_list: a list of (1, char) and (0, offset, length) tuples
+    :best and worst case: O(T) with T as the number of tokens
+    :return: the number of bytes the tokens decode to
+    """
+    total = 0
+    for code in code_list:
+        total += 1 if code[0] == 1 else code[2]
+    return total
+
+def copy_match(buf, pos, offset, length):
+    """
+    A function to copy a back-reference inside buf: the length bytes starting offset
+    bytes before pos are copied to pos. A reference that does not overlap its own
+    output (offset >= length) takes a single slice assignment; an overlapping one is
+    copied by repeated doubling, since the bytes already copied become part of the
+    source.
+    :param buf: a bytearray or writable memoryview already long enough for the copy
+    :param pos: the position the copy is written to
+    :param offset: the distance back to the source, at least 1
+    :param length: the number of bytes to copy
+    :best case: O(length) for a non-overlapping reference
+    :worst case: O(length + log length) slice operations when offset is 1
+    :return: the position after the copy
+    """
+    src = pos - offset
+    end = pos + length
+    while pos < end:
+        size = min(pos - src, end - pos)
+        buf[pos:pos + size] = buf[src:src + size]
+        pos += size
+    return pos
+
+def decode_lzss_bytes(codes):
+    """
+    A function to decode LZSS into bytes. Unlike decode_lzss, the output is written
+    into a preallocated bytearray through a memoryview instead of concatenating
+    strings, so each token costs O(1) slice operations rather than O(N) copies.
+
+    A back-reference whose offset is at least its length does not overlap its own
+    output and is copied with a single slice assignment. An overlapping one
+    (offset < length) is copied by repeated doubling: the first copy is `offset`
+    bytes long, and each copy after that can take twice as much as the one before
+    since the already-copied bytes become part of the source.
+
+    :param codes: either an iterable of (1, char) and (0, offset, length) tuples or a
+    packed binary token stream (bytes, bytearray or memoryview) from pack_lzss
+    :best case: O(N) with N as the length of the output
+    :worst case: O(N + T log L) with T as the number of tokens and L as the longest
+    overlapping match
+    :aux space complexity: O(1) besides the output
+    :space complexity: O(N)
+    :return: the decoded bytes
+    """
+    if isinstance(codes, (bytes, bytearray, memoryview)):
+        try:
+            total, _ = read_varint(codes, 0)
+        except IndexError:
+            raise Exception("Malformed LZSS stream")
+        codes = unpack_lzss(codes)
+    else:
+        # an iterator would be used up by decoded_length
+        codes = list(codes)
+        total = decoded_length(codes)
+
+    out = bytearray(total)
+    view = memoryview(out)
+    pos = 0
+
+    for code in codes:
+        if code[0] == 1:
+            if pos >= total:
+                raise Exception("Malformed LZSS stream")
+            char = code[1]
+            view[pos] = char if isinstance(char, int) else ord(char)
+            pos += 1
+
+        elif code[0] == 0:
+            offset = code[1]
+            end = pos + code[2]
+            src = pos - offset
+            if offset <= 0 or src < 0 or end > total:
+                raise Exception("Invalid LZSS back-reference")
+
+            pos = copy_match(view, pos, offset, code[2])
+
+        else:
+            raise Exception("Not LZSS")
+
+    view.release()
+    if pos != total:
+        raise Exception("Malformed LZSS stream")
+    return bytes(out)
+
+if __name__ == "__main__":
+    lst = [(1,"a"),(1,"a"),(1,"c"),(0,3,4),(1,"b"),(0,3,3),(1,"a")]
+    print(decode_lzss(lst))
+    print(decode_lzss_bytes(pack_lzss(lst)).decode())
@@ -3,6 +3,8 @@
 @created 29 June 2019
 @modified 30 May 2020
 """
+import heapq
+from array import array
 
 class PriorityQueue:
     """
@@ -72,11 +74,11 @@ class PriorityQueue:
             raise Exception("Heap is full")
 
         self.counter += 1
-        self.__rise(self.counter)
+        self._rise(self.counter)
 
-    def __rise(self, k):
+    def _rise(self, k):
         """
-        A private method to perform rise. Rise happens to make the heap consistent as a
+        A protected method to perform rise. Rise happens to make the heap consistent as a
         minimum heap by swapping smaller child with its parents.
         :param k: the element's position that needs to be swapped.
         :best case: O(1) when k < 1 and child (self.array[k]) is smaller than its parents.
@@ -105,12 +107,12 @@ class PriorityQueue:
         to_return = self.array[1]
         self.swap(1,self.counter)
         self.counter -= 1
-        self.__sink(1)
+        self._sink(1)
         return to_return
 
-    def __sink(self, k):
+    def _sink(self, k):
         """
-        A private method to perform sink. sink happens to make the heap consistent as a
+        A protected method to perform sink. sink happens to make the heap consistent as a
         minimum heap by swapping bigger parents with its child.
         :param k: the element's position that needs to be swapped.
         :best case: O(N) with N as the number of element(s) in the queue. This happens
@@ -169,7 +171,459 @@ class PriorityQueue:
                 temp = self.array[i][1]
                 self.array[i] = (key,value)
                 if temp > value:
-                    self.__rise(i)
+                    self._rise(i)
                 else:
-                    self.__sink(i)
+                    self._sink(i)
                 break
+
+    def heapify(self):
+        """
+        A method to restore the heap order of the whole array by sinking every parent,
+        from the last one up to the root.
+        :best and worst case: O(N) with N as the number of element(s) in the queue.
+        :aux space complexity: O(1)
+        :space complexity: O(1)
+        """
+        for k in range(self.counter//2, 0, -1):
+            self._sink(k)
+
+    def push_many(self, entries):
+        """
+        A method to add a batch of (key, value) tuples. When the batch is at least as
+        large as the queue, the tuples are appended unordered and the heap is rebuilt
+        with heapify instead of rising each of them.
+        :param entries: a sequence of (key, value) tuples
+        :best case: O(M) with M as the length of entries when all of them are larger
+        than their parents.
+        :worst case: O(MlogN) with N as the number of element(s) after the push, or
+        O(N) when the heap is rebuilt.
+        :aux space complexity: O(1)
+        :space complexity: O(N)
+        """
+        start = self.counter
+        total = start + len(entries)
+        if total + 1 > len(self.array):
+            raise Exception("Heap is full")
+        self.array[start + 1:total + 1] = entries
+        self.counter = total
+        if len(entries) >= start:
+            self.heapify()
+        else:
+            for k in range(start + 1, total + 1):
+                self._rise(k)
+
+    def serve_many(self, k):
+        """
+        A method to serve up to k elements.
+        :param k: the number of elements wanted
+        :best and worst case: O(klogN) with N as the number of element(s) in the queue.
+        :aux space complexity: O(k)
+        :space complexity: O(k)
+        :return: a list of at most k tuples in increasing order of value.
+        """
+        return [self.serve() for _ in range(min(k, self.counter))]
+
+    def nsmallest(self, k):
+        """
+        A method to get the k smallest elements without removing them. A second
+        small heap holds the frontier of positions still to visit, starting at the
+        root; visiting a position adds its two children.
+        :param k: the number of elements wanted
+        :best and worst case: O(klogk)
+        :aux space complexity: O(k)
+        :space complexity: O(k)
+        :return: a list of at most k tuples in increasing order of value.
+        """
+        to_return = []
+        if self.counter == 0:
+            return to_return
+        frontier = [(self.array[1][1], 1)]
+        while frontier and len(to_return) < k:
+            _, i = heapq.heappop(frontier)
+            to_return.append(self.array[i])
+            for child in (2*i, 2*i + 1):
+                if child <= self.counter:
+                    heapq.heappush(frontier, (self.array[child][1], child))
+        return to_return
+
+    def merge(self, other):
+        """
+        A method to add every element of other into this queue and rebuild the heap
+        once. other is left unchanged.
+        :param other: a PriorityQueue
+        :best and worst case: O(N + M) with N and M as the number of element(s) in
+        both queues.
+        :aux space complexity: O(1)
+        :space complexity: O(N + M)
+        """
+        total = self.counter + other.counter
+        if total + 1 > len(self.array):
+            raise Exception("Heap is full")
+        self.array[self.counter + 1:total + 1] = other.array[1:other.counter + 1]
+        self.counter = total
+        self.heapify()
+
+    def drain(self):
+        """
+        A generator that serves elements until the queue is empty.
+        :best and worst case: O(NlogN) with N as the number of element(s) in the queue.
+        :return: an iterator over tuples in increasing order of value.
+        """
+        while self.counter > 0:
+            yield self.serve()
+
+
+class IndexedPriorityQueue(PriorityQueue):
+    """
+    This class implements a Minimum Heap / Priority Queue that also keeps the position
+    of every key in the heap, so a key can be found without scanning the array. The
+    position map is a dict, or a list indexed by key when the keys are the integers
+    0 to max_key (such as vertex IDs); 0 marks a key that is not in the queue since the
+    heap starts at position 1. Every key can be in the queue at most once.
+    """
+    def __init__(self, size, max_key=None):
+        """
+        A constructor to initialise the priority queue and the position map.
+        :param size: the size of the array, which holds size - 1 elements
+        :param max_key: the largest integer key, None to allow any hashable key
+        """
+        PriorityQueue.__init__(self, size)
+        self.position = {} if max_key is None else [0]*(max_key + 1)
+
+    def contains(self, key):
+        """
+        A method to check whether key is in the queue.
+        :param key: the key to look for
+        :best and worst case: O(1)
+        :aux space complexity: O(1)
+        :space complexity: O(1)
+        :return: True if key is in the queue and False if otherwise.
+        """
+        if isinstance(self.position, dict):
+            return key in self.position
+        return 0 <= key < len(self.position) and self.position[key] != 0
+
+    def __contains__(self, key):
+        """
+        A method to support the in operator, see contains.
+        :param key: the key to look for
+        :best and worst case: O(1)
+        :return: True if key is in the queue and False if otherwise.
+        """
+        return self.contains(key)
+
+    def forget(self, key):
+        """
+        A method to remove key from the position map.
+        :param key: a key that has left the heap
+        :best and worst case: O(1)
+        """
+        if isinstance(self.position, dict):
+            del self.position[key]
+        else:
+            self.position[key] = 0
+
+    def add(self, key, value):
+        """
+        A method to append an element to the queue and record its position.
+        :param key: a key of the value that is not in the queue yet
+        :param value: a value of the key
+        :best case: O(1) when the value is not smaller than its parent.
+        :worst case: O(logN) with N as the number of element(s) in the queue.
+        :aux space complexity: O(1)
+        :space complexity: O(N)
+        """
+        if self.counter + 1 >= len(self.array):
+            raise Exception("Heap is full")
+        if self.contains(key):
+            raise Exception("Key is already in the queue")
+        self.position[key] = self.counter + 1
+        PriorityQueue.add(self, key, value)
+
+    def serve(self):
+        """
+        A method to get the element with the minimum value and remove its key from
+        the position map.
+        :best case: O(1) when there is only 1 element in the queue.
+        :worst case: O(logN) with N as the number of element(s) in the queue.
+        :aux space complexity: O(1)
+        :space complexity: O(1)
+        :return: a tuple of minimum value.
+        """
+        to_return = PriorityQueue.serve(self)
+        self.forget(to_return[0])
+        return to_return
+
+    def swap(self, i, j):
+        """
+        A method to swap 2 elements in the queue and update their positions.
+        :param i: the element's position that needs to be swapped.
+        :param j: the element's position that needs to be swapped.
+        :best and worst case: O(1)
+        :aux space complexity: O(1)
+        :space complexity: O(1)
+        """
+        array = self.array
+        array[i], array[j] = array[j], array[i]
+        self.position[array[i][0]] = i
+        self.position[array[j][0]] = j
+
+    def update(self, key, value):
+        """
+        A method to update the value of key. The position map gives its place in the
+        heap, then a rise is performed if the new value is smaller and a sink otherwise.
+        :param key: the key of which value to be updated
+        :param value: the updated value
+        :best case: O(1) when the element stays in place.
+        :worst case: O(logN) with N as the number of element(s) in the queue.
+        :aux space complexity: O(1)
+        :space complexity: O(1)
+        """
+        if not self.contains(key):
+            raise Exception("Key is not in the queue")
+        i = self.position[key]
+        temp = self.array[i][1]
+        self.array[i] = (key, value)
+        if temp > value:
+            self._rise(i)
+        else:
+            self._sink(i)
+
+    def register(self, entries):
+        """
+        A method to record the positions entries will take when they are appended
+        after the last element.
+        :param entries: a sequence of (key, value) tuples whose keys are new
+        :best and worst case: O(M) with M as the length of entries
+        """
+        keys = set()
+        for key, _ in entries:
+            if key in keys or self.contains(key):
+                raise Exception("Key is already in the queue")
+            keys.add(key)
+        for i, (key, _) in enumerate(entries):
+            self.position[key] = self.counter + 1 + i
+
+    def push_many(self, entries):
+        """
+        A method to add a batch of (key, value) tuples with new keys, recording their
+        positions first so the swaps done by the rebuild keep the map correct.
+        :param entries: a sequence of (key, value) tuples
+        :best case: O(M) with M as the length of entries
+        :worst case: O(MlogN) with N as the number of element(s) after the push.
+        """
+        if self.counter + len(entries) + 1 > len(self.array):
+            raise Exception("Heap is full")
+        self.register(entries)
+        PriorityQueue.push_many(self, entries)
+
+    def merge(self, other):
+        """
+        A method to add every element of other, whose keys must not be in this queue.
+        :param other: a PriorityQueue
+        :best and worst case: O(N + M) with N and M as the number of element(s) in
+        both queues.
+        """
+        if self.counter + other.counter + 1 > len(self.array):
+            raise Exception("Heap is full")
+        self.register(other.array[1:other.counter + 1])
+        PriorityQueue.merge(self, other)
+
+    def remove(self, key):
+        """
+        A method to remove key from the queue wherever it is. The last element takes
+        its place and is then rised or sunk to restore the heap.
+        :param key: the key to be removed
+        :best case: O(1) when key is the last element.
+        :worst case: O(logN) with N as the number of element(s) in the queue.
+        :aux space complexity: O(1)
+        :space complexity: O(1)
+        :return: the removed (key, value) tuple.
+        """
+        if not self.contains(key):
+            raise Exception("Key is not in the queue")
+        i = self.position[key]
+        to_return = self.array[i]
+        self.swap(i, self.counter)
+        self.counter -= 1
+        self.forget(key)
+        if i <= self.counter:
+            self._rise(i)
+            self._sink(i)
+        return to_return
+
+
+class ArrayPriorityQueue:
+    """
+    This class implements a growable Minimum Heap / Priority Queue that stores the keys
+    and the values in two parallel compact arrays instead of a list of tuples: keys are
+    64-bit integers (array('q')) and values are floats (array('d')). The heap starts at
+    position 0 and the arrays double in size when they are full.
+    """
+    def __init__(self, capacity=16):
+        """
+        A constructor to initialise the priority queue with room for capacity elements.
+        :param capacity: the initial number of slots
+        """
+        capacity = max(1, capacity)
+        self.keys = array("q", bytes(8*capacity))
+        self.values = array("d", bytes(8*capacity))
+        self.counter = 0
+
+    @classmethod
+    def from_arrays(cls, keys, values):
+        """
+        A method to build a priority queue from parallel sequences of keys and values
+        with a bottom-up heapify, sinking every parent from the last one to the root.
+        :param keys: a sequence of integers
+        :param values: a sequence of numbers of the same length
+        :best and worst case: O(N) with N as the number of elements
+        :aux space complexity: O(N)
+        :return queue: an ArrayPriorityQueue holding the elements
+        """
+        if len(keys) != len(values):
+            raise Exception("Keys and values differ in length")
+        queue = cls(1)
+        queue.keys = array("q", keys)
+        queue.values = array("d", values)
+        queue.counter = len(queue.keys)
+        if queue.counter == 0:
+            queue.keys.append(0)
+            queue.values.append(0.0)
+        for k in range(queue.counter//2 - 1, -1, -1):
+            queue.sink(k)
+        return queue
+
+    @classmethod
+    def from_iterable(cls, entries):
+        """
+        A method to build a priority queue from (key, value) pairs in O(N).
+        :param entries: an iterable of (key, value) tuples
+        :best and worst case: O(N) with N as the number of elements
+        :aux space complexity: O(N)
+        :return: an ArrayPriorityQueue holding the elements
+        """
+        keys = array("q")
+        values = array("d")
+        for key, value in entries:
+            keys.append(key)
+            values.append(value)
+        return cls.from_arrays(keys, values)
+
+    def is_empty(self):
+        """
+        A method that return a boolean indicating whether priority queue is empty or not
+        :best and worst case: O(1)
+        :return: True if the queue is empty and False if otherwise.
+        """
+        return self.counter == 0
+
+    def __len__(self):
+        """
+        A method to calculate the number of element(s) in the queue.
+        :best and worst case: O(1)
+        :return: an integer indicating the number of element(s) in the queue.
+        """
+        return self.counter
+
+    def grow(self):
+        """
+        A method to double the size of both arrays.
+        :best and worst case: O(N), amortized O(1) per added element
+        :aux space complexity: O(N)
+        """
+        self.keys.extend(self.keys)
+        self.values.extend(self.values)
+
+    def add(self, key, value):
+        """
+        A method to append an element to the queue, growing the arrays when full.
+        :param key: an integer key
+        :param value: the value the queue is ordered by
+        :best case: O(1) when the value is not smaller than its parent.
+        :worst case: O(logN) with N as the number of element(s) in the queue.
+        :aux space complexity: O(1) amortized
+        """
+        if self.counter == len(self.keys):
+            self.grow()
+        self.keys[self.counter] = key
+        self.values[self.counter] = value
+        self.counter += 1
+        self.rise(self.counter - 1)
+
+    def peek(self):
+        """
+        A method to get the element with the minimum value without removing it.
+        :best and worst case: O(1)
+        :return: a (key, value) tuple.
+        """
+        if self.counter == 0:
+            raise Exception("Heap is empty")
+        return self.keys[0], self.values[0]
+
+    def serve(self):
+        """
+        A method to remove and return the element with the minimum value. The last
+        element is moved to the root and sunk.
+        :best case: O(1) when there is only 1 element in the queue.
+        :worst case: O(logN) with N as the number of element(s) in the queue.
+        :aux space complexity: O(1)
+        :return: a (key, value) tuple of the minimum value.
+        """
+        if self.counter == 0:
+            raise Exception("Heap is empty")
+        to_return = (self.keys[0], self.values[0])
+        self.counter -= 1
+        if self.counter > 0:
+            self.keys[0] = self.keys[self.counter]
+            self.values[0] = self.values[self.counter]
+            self.sink(0)
+        return to_return
+
+    def rise(self, k):
+        """
+        A method to move the element at position k up while it is smaller than its
+        parent. The parents are shifted down and the element is written once at the end.
+        :param k: the element's position
+        :best case: O(1)
+        :worst case: O(logN) with N as the number of element(s) in the queue.
+        """
+        keys = self.keys
+        values = self.values
+        key = keys[k]
+        value = values[k]
+        while k > 0:
+            parent = (k - 1)//2
+            if values[parent] <= value:
+                break
+            keys[k] = keys[parent]
+            values[k] = values[parent]
+            k = parent
+        keys[k] = key
+        values[k] = value
+
+    def sink(self, k):
+        """
+        A method to move the element at position k down while a child is smaller,
+        shifting the smaller child up at every level.
+        :param k: the element's position
+        :best case: O(1)
+        :worst case: O(logN) with N as the number of element(s) in the queue.
+        """
+        keys = self.keys
+        values = self.values
+        counter = self.counter
+        key = keys[k]
+        value = values[k]
+        child = 2*k + 1
+        while child < counter:
+            if child + 1 < counter and values[child + 1] < values[child]:
+                child += 1
+            if value <= values[child]:
+                break
+            keys[k] = keys[child]
+            values[k] = values[child]
+            k = child
+            child = 2*k + 1
+        keys[k] = key
+        values[k] = value
@@ -11,96 +11,431 @@ Code is adapted from live coding session by Dr. Ian Lim Wern Han
 @Monash University Malaysia.
 """
 import copy
+import json
+import os
+import platform
+import time
+from array import array
 
-def radix_sort(num_list,b):
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Thresholds of the adaptive mode (radix_sort with b=None). The defaults follow the
+# measurements on CPython, where neither insertion sort nor radix sort beat sorted()
+# at any size tried, so the adaptive mode uses sorted() until calibrate() (or
+# load_calibration() with a file written by it) finds a crossover on the host.
+INSERTION_CUTOFF = 0        # at most this many items: insertion sort
+BUILTIN_CUTOFF = None       # at most this many items: sorted(), None for always
+NEARLY_SORTED = 0.01        # at most this fraction of descents: sorted()
+BUCKET_WEIGHT = 0.5         # cost of one bucket relative to one item in a pass
+MAX_RADIX_BITS = 20
+
+def radix_sort(num_list,b=None,key=None):
     """
-    This function will sort a list of integer(s) in increasing order using radix
-    sort based on b. The implementation would be copying our num_list into another
-    list since we cannot modify it. Then, we determine the maximum length of the
-    greatest number in the list.
+    This function will sort a list of integer(s) in increasing order
+    using LSD radix sort based on b. Every pass is a stable counting sort on one
+    digit of base b: the digits are counted, the counts are turned into starting
+    positions with a prefix sum, and every number is written straight to its
+    position in an output buffer. The input and output buffers swap roles after
+    each pass, so no buckets are built and nothing is popped from the front of a list.
 
-    To know how many times we have to perform counting sort, we have to know how long
-    is our greatest number in num_list when it's represented in b. To do so, we
-    calculate the result of floor division (//) of the number//base^power. Power will
-    go all the way from 0 until M where the result of // is smaller than our base.
+    The number of passes M is the number of digits of the greatest number in num_list
+    when it is represented in base b. When b is a power of 2 the digits are taken
+    with a shift and a mask instead of a division and a modulo. Negative numbers
+    are sorted by subtracting the smallest number first and adding it back after.
+
+    When key is given, num_list can hold any records (e.g. (u, v, w) edge tuples)
+    and they are sorted stably by key(record) through radix_argsort: only an index
+    permutation moves between the buffers and the records are picked up once at the end.
+
+    :precondition: num_list must consist integer(s), or key must return an integer
+    for every item, yet num_list can be empty too. b must be greater than 1.
+
+    When b is None the adaptive mode (adaptive_sort) picks the strategy and the base.
+
+    :param num_list: list of integers (or records when key is given) to be sorted
+    :param b: base number, None to choose it automatically
+    :param key: a function returning the integer key of an item, None to sort the
+    items themselves
 
-    Then, we initialise our count_array with the size of b and initialise another list
-    inside each index of count_array. After doing all necessaries steps, we can perform
-    counting sort for MN times to achieve our desired output. (Further explaination
-    will be in the comments below)
-    
-    :precondition: num_list must consist integer(s), yet num_list can be empty too.
-    b must be greater than 0.
-    
-    :param num_list: list of integers to be sorted
-    :param b: base number
-    
     :Best case: O(M(N+b)) when num_list is sorted with M as the length of the largest
     digit in terms of base b, N as the length of num_list, and b as base because num_list
     still has to go through the multiple counting sorts.
-    
+
     :Worst case: O(M(N+b)) when num_list is unsorted with M as the length of the largest
     digit in terms of base b, N as the length of num_list, and b as base because num_list
     has to go through the multiple counting sorts.
-    
-    :Space complexity: O(MN+b+N) with M as the length of the largest digit in terms
-    of base b, N as the length of num_list, and b as base.
-    
-    :Aux space complexity: O(N+b) with b as the base and N as the length of the num_list
-    
+
+    :Space complexity: O(N+b) with N as the length of num_list, and b as base.
+
+    :Aux space complexity: O(N+b) for the second buffer, the digits and the counts.
+
     :return num_list_sorted: sorted list in ascending order.
     """
-    
-    #Step 1 - Copy num_list
-    num_list_sorted = copy.deepcopy(num_list)
+    if b is None:
+        return adaptive_sort(num_list, key)
+    if b < 2:
+        raise Exception("Base must be greater than 1")
 
+    if key is not None:
+        items = list(num_list)
+        return [items[i] for i in radix_argsort([key(item) for item in items], b)]
 
-    #Step 2 - Look for which item has the longest length
-    #Code below will run in O(N-1) time with N as the total item in the input list
-    max_item = 0
+    #Step 1 - Copy num_list into the first buffer and allocate the second one
+    num_list_sorted = list(num_list)
+    n = len(num_list_sorted)
+    if n <= 1:
+        return num_list_sorted
+    buffer = [0]*n
 
-    for i in range(len(num_list_sorted)):
-        current_max_num = len(str(num_list_sorted[i]))
-        if num_list_sorted[i] > max_item:
-            max_item = num_list_sorted[i]
+    #Step 2 - Look for the smallest and greatest number, the greatest decides the
+    #number of passes. Negative numbers are shifted to start from 0.
+    min_item = min(num_list_sorted)
+    if min_item < 0:
+        shifted = radix_sort([num - min_item for num in num_list_sorted], b)
+        return [num + min_item for num in shifted]
+    max_item = max(num_list_sorted)
 
-    max_item_length = len(str(max_item))
+    #Step 3 - Perform one counting sort for every digit of max_item in base b,
+    #from the least significant digit
+    power_of_two = b & (b - 1) == 0
+    mask = b - 1
+    shift = 0
+    place = 1
 
-    #Step 3 - Find the number of digits of maxItem, when represented in base b
-    #Code below will run in O(M) time with M as the number of digits of MaxItem,
-    #represented in base b.
-    convert_length = 1
-    power = 0
+    while max_item // place > 0:
+        #Step 3.1 - Extract the digit of every number, run in O(N) time
+        if power_of_two:
+            digits = [(num >> shift) & mask for num in num_list_sorted]
+        else:
+            digits = [(num // place) % b for num in num_list_sorted]
 
-    while (max_item//b**power) > b:
-        convert_length += 1
-        power += 1
+        #Step 3.2 - Count the digits and turn the counts into starting positions
+        count_array = [0]*b
+        for digit in digits:
+            count_array[digit] += 1
+        total = 0
+        for i in range(b):
+            count = count_array[i]
+            count_array[i] = total
+            total += count
 
-    #Step 4 - Create count_array based on b
-    #Code below will run in O(b) time with b as the base
-    count_array = [0]*b
-    for i in range(len(count_array)):
-        count_array[i] = []
+        #Step 3.3 - Scatter into the other buffer, stable since num_list_sorted
+        #is read from left to right
+        for num, digit in zip(num_list_sorted, digits):
+            position = count_array[digit]
+            buffer[position] = num
+            count_array[digit] = position + 1
 
-    #Step 5 - Create an outer loop for M times (M = the number of digits of
-    #maxItem, when represented in base b) to ensure that numbers in our input
-    #list are sorted based on the given b.
-    
-    for i in range(convert_length):
-        for j in range(len(num_list_sorted)): #run in O(N) time
-            index = (num_list_sorted[j]//b**i)%b
-            count_array[index].append(num_list_sorted[j])
-
-        #code below runs in O(ba) time with a as the length of count_array[j]
-        index = 0
-        for j in range(len(count_array)):
-            for k in range(len(count_array[j])):
-                num_list_sorted[index] = count_array[j].pop(0)
-                index += 1
+        num_list_sorted, buffer = buffer, num_list_sorted
+        shift += mask.bit_length()
+        place *= b
 
-    #Step 6 - Return sorted list
+    #Step 4 - Return sorted list
     return num_list_sorted
 
+def choose_base(n, key_range):
+    """
+    This function chooses the base of a radix sort of n keys spanning key_range.
+    A base of 2^r needs ceil(bits / r) passes, each touching the n keys and the 2^r
+    buckets, so the r with the smallest passes * (n + BUCKET_WEIGHT * 2^r) is taken.
+    :param n: the number of keys
+    :param key_range: the greatest key minus the smallest key
+    :Best and worst case: O(MAX_RADIX_BITS)
+    :return: the base, a power of 2
+    """
+    bits = max(1, key_range.bit_length())
+    best_base = 2
+    best_cost = None
+    for r in range(1, min(bits, MAX_RADIX_BITS) + 1):
+        passes = -(-bits // r)
+        cost = passes*(n + BUCKET_WEIGHT*(1 << r))
+        if best_cost is None or cost < best_cost:
+            best_cost = cost
+            best_base = 1 << r
+    return best_base
+
+def count_descents(keys):
+    """
+    This function counts the positions where a key is greater than the next one.
+    :param keys: list of comparable keys
+    :Best and worst case: O(N) with N as the length of keys
+    :return: the number of descents, 0 when keys is sorted
+    """
+    return sum(1 for i in range(len(keys) - 1) if keys[i] > keys[i + 1])
+
+def adaptive_sort(num_list, key=None):
+    """
+    This function is the adaptive mode of radix_sort. Tiny inputs are insertion
+    sorted (up to INSERTION_CUTOFF items) or passed to sorted() (up to BUILTIN_CUTOFF
+    items). Larger inputs are checked for order first: a sorted input is returned
+    as a copy, and a nearly-sorted one (at most NEARLY_SORTED descents per item) is
+    passed to sorted(), whose merge of natural runs is close to linear there. Anything
+    else is radix sorted with the base from choose_base.
+    :param num_list: list of integers, or records when key is given
+    :param key: a function returning the integer key of an item, None to sort the
+    items themselves
+    :Best case: O(N) when num_list is sorted
+    :Worst case: O(M(N+b)) as radix_sort, with b from choose_base
+    :Aux space complexity: O(N+b)
+    :return: sorted list in ascending order
+    """
+    items = list(num_list)
+    n = len(items)
+
+    if n <= INSERTION_CUTOFF and key is None:
+        insertion_sort(items)
+        return items
+    if BUILTIN_CUTOFF is None or n <= BUILTIN_CUTOFF:
+        return sorted(items, key=key)
+
+    keys = items if key is None else [key(item) for item in items]
+    descents = count_descents(keys)
+    if descents == 0:
+        return items
+    if descents <= n*NEARLY_SORTED:
+        return sorted(items, key=key)
+
+    b = choose_base(n, max(keys) - min(keys))
+    if key is None:
+        return radix_sort(items, b)
+    return [items[i] for i in radix_argsort(keys, b)]
+
+def load_calibration(path):
+    """
+    This function sets the adaptive mode thresholds from a file written by calibrate.
+    :param path: the calibration file
+    :return: True if the file was loaded, False if it does not exist
+    """
+    global INSERTION_CUTOFF, BUILTIN_CUTOFF, NEARLY_SORTED, BUCKET_WEIGHT
+    if not os.path.exists(path):
+        return False
+    with open(path) as file:
+        calibration = json.load(file)
+    INSERTION_CUTOFF = calibration["insertion_cutoff"]
+    BUILTIN_CUTOFF = calibration["builtin_cutoff"]
+    NEARLY_SORTED = calibration["nearly_sorted"]
+    BUCKET_WEIGHT = calibration["bucket_weight"]
+    return True
+
+def best_time(func, data, repeat=3):
+    """
+    This function times func on fresh copies of data.
+    :param func: a function taking a list
+    :param data: the list to pass, copied for every run
+    :param repeat: the number of runs
+    :return: the fastest run in seconds
+    """
+    best = None
+    for _ in range(repeat):
+        copy_of_data = list(data)
+        start = time.perf_counter()
+        func(copy_of_data)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def calibrate(path=None, max_size=1 << 17, seed=40):
+    """
+    This function measures the crossover points of the adaptive mode on this machine,
+    applies them and, when path is given, writes them to it as JSON:
+    insertion_cutoff is the largest size at which insertion sort beats sorted(),
+    builtin_cutoff the size below the first one at which radix sort beats sorted()
+    (None if radix sort never won up to max_size), and bucket_weight the measured
+    cost of one bucket relative to one item in a counting sort pass.
+    :param path: the calibration file, None to not write one
+    :param max_size: the largest input size tried
+    :param seed: the random seed of the inputs
+    :return calibration: the dict that was written
+    """
+    import random
+    global INSERTION_CUTOFF, BUILTIN_CUTOFF, BUCKET_WEIGHT
+    rng = random.Random(seed)
+
+    insertion_cutoff = 0
+    for n in (2, 4, 8, 16, 32, 64):
+        data = [rng.getrandbits(32) for _ in range(n)]
+        if best_time(insertion_sort, data, 50) <= best_time(sorted, data, 50):
+            insertion_cutoff = n
+
+    # one pass over many items and few buckets, then one over few items and many buckets
+    items = 1 << 15
+    per_item = best_time(lambda data: radix_sort(data, 2), [rng.getrandbits(1) for _ in range(items)]) / items
+    per_bucket = best_time(lambda data: radix_sort(data, 1 << 16), [0, (1 << 16) - 1]) / (1 << 16)
+    bucket_weight = per_bucket / per_item
+    BUCKET_WEIGHT = bucket_weight
+
+    builtin_cutoff = None
+    n = 64
+    previous = 64
+    while n <= max_size:
+        data = [rng.getrandbits(32) for _ in range(n)]
+        radix_time = best_time(lambda data: radix_sort(data, choose_base(len(data), 1 << 32)), data)
+        if radix_time < best_time(sorted, data):
+            builtin_cutoff = previous
+            break
+        previous = n
+        n <<= 1
+
+    calibration = {
+        "insertion_cutoff": insertion_cutoff,
+        "builtin_cutoff": builtin_cutoff,
+        "nearly_sorted": NEARLY_SORTED,
+        "bucket_weight": bucket_weight,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+    }
+    INSERTION_CUTOFF = insertion_cutoff
+    BUILTIN_CUTOFF = builtin_cutoff
+    if path is not None:
+        with open(path, "w") as file:
+            json.dump(calibration, file, indent=2)
+    return calibration
+
+def radix_argsort(keys,b):
+    """
+    This function returns the permutation that stably sorts a list of integer keys,
+    i.e. keys[perm[0]] <= keys[perm[1]] <= ... with equal keys kept in input order.
+    It is the same LSD counting sort as radix_sort, but the buffers hold indices:
+    on every pass the digit of each key is computed once in input order and the
+    current permutation is scattered by looking it up. Negative keys are shifted by
+    the smallest key.
+
+    :precondition: keys must consist integer(s), yet keys can be empty too. b must
+    be greater than 1.
+
+    :param keys: list of integer keys
+    :param b: base number
+
+    :Best and worst case: O(M(N+b)) with M as the number of digits of the key range
+    in base b, N as the length of keys, and b as base.
+
+    :Aux space complexity: O(N+b) for the second buffer, the digits and the counts.
+
+    :return perm: list of indices of keys in sorted order.
+    """
+    if b < 2:
+        raise Exception("Base must be greater than 1")
+
+    #Step 1 - Start from the identity permutation
+    n = len(keys)
+    perm = list(range(n))
+    if n <= 1:
+        return perm
+    buffer = [0]*n
+
+    #Step 2 - Shift negative keys and find the number of passes
+    min_key = min(keys)
+    if min_key < 0:
+        keys = [k - min_key for k in keys]
+    max_key = max(keys)
+
+    power_of_two = b & (b - 1) == 0
+    mask = b - 1
+    shift = 0
+    place = 1
+
+    #Step 3 - One stable counting sort pass on the indices per digit
+    while max_key // place > 0:
+        if power_of_two:
+            digits = [(k >> shift) & mask for k in keys]
+        else:
+            digits = [(k // place) % b for k in keys]
+
+        count_array = [0]*b
+        for digit in digits:
+            count_array[digit] += 1
+        total = 0
+        for i in range(b):
+            count = count_array[i]
+            count_array[i] = total
+            total += count
+
+        for idx in perm:
+            digit = digits[idx]
+            position = count_array[digit]
+            buffer[position] = idx
+            count_array[digit] = position + 1
+
+        perm, buffer = buffer, perm
+        shift += mask.bit_length()
+        place *= b
+
+    return perm
+
+def radix_sort_numpy(keys, radix_bits=None):
+    """
+    This function sorts a NumPy integer array or an array.array of integers with a
+    vectorized LSD radix sort, so no Python int is created per element. Every pass
+    extracts one digit for the whole array with a shift and a mask, histograms the
+    digits with bincount and moves the keys with a stable argsort of the digits.
+    NumPy sorts 8 and 16 bit integers with a counting sort when kind="stable", so
+    the argsort is the cumulative-sum scatter of a counting sort done in C.
+
+    Signed keys are mapped to unsigned ones by flipping the sign bit. Only the bits
+    below the highest bit in which the smallest and the greatest key differ are
+    sorted on, and a pass is skipped when the histogram shows a single digit.
+
+    :precondition: numpy is installed and keys has an integer dtype (or typecode).
+    :param keys: a 1-d NumPy integer array or an array.array with an integer typecode
+    :param radix_bits: bits per digit, chosen from the key width and the length of
+    keys when None: 8 bits for 1 byte keys or fewer than 2^16 keys, 16 bits otherwise
+    :Best and worst case: O(M(N+2^r)) with M as the number of passes, N as the length
+    of keys and r as radix_bits
+    :Aux space complexity: O(N+2^r)
+    :Space complexity: O(N)
+    :return: a sorted copy of keys of the same type (NumPy array or array.array)
+    """
+    if np is None:
+        raise Exception("radix_sort_numpy needs numpy")
+
+    typecode = None
+    if isinstance(keys, array):
+        typecode = keys.typecode
+        values = np.frombuffer(keys, dtype=np.dtype(typecode)) if len(keys) else np.array([], dtype=np.dtype(typecode))
+    else:
+        values = np.asarray(keys)
+    if values.dtype.kind not in "iu" or values.ndim != 1:
+        raise Exception("radix_sort_numpy needs a 1-d integer array")
+
+    #Step 1 - Map the keys to unsigned integers of the same width
+    width = values.dtype.itemsize*8
+    unsigned = np.dtype("u%d" % values.dtype.itemsize)
+    if values.dtype.kind == "i":
+        sign = unsigned.type(1 << (width - 1))
+        work = values.view(unsigned) ^ sign
+    else:
+        sign = None
+        work = values.copy()
+
+    #Step 2 - Choose the radix and the number of passes
+    n = len(work)
+    if radix_bits is None:
+        radix_bits = 8 if width == 8 or n < (1 << 16) else 16
+    radix_bits = min(radix_bits, width)
+    mask = unsigned.type((1 << radix_bits) - 1)
+    digit_type = np.uint8 if radix_bits <= 8 else np.uint16 if radix_bits <= 16 else np.uint32
+    used_bits = int(work.min() ^ work.max()).bit_length() if n else 0
+
+    #Step 3 - One stable counting sort pass per digit
+    for shift in range(0, used_bits, radix_bits):
+        digits = ((work >> unsigned.type(shift)) & mask).astype(digit_type)
+        counts = np.bincount(digits, minlength=1 << radix_bits)
+        if counts.max() == n:
+            continue
+        work = work[np.argsort(digits, kind="stable")]
+
+    #Step 4 - Map back to the original type
+    if sign is not None:
+        result = (work ^ sign).view(values.dtype)
+    else:
+        result = work.astype(values.dtype, copy=False)
+    if typecode is not None:
+        return array(typecode, result.tobytes())
+    return result
+
 def radix_sort_alpha(string_list):
     """
     This function will sort a list of string(s) in right-aligned (based on the length
@@ -180,3 +515,122 @@ def radix_sort_alpha(string_list):
 
     #Step 5 - Returning sorted list
     return word_list
+
+
+def insertion_sort(word_list):
+    """
+    This function sorts a short list in place with insertion sort.
+    :param word_list: list of comparable items
+    :Best case: O(N) when word_list is sorted
+    :Worst case: O(N^2) when word_list is in reverse order
+    :Aux space complexity: O(1)
+    :return: None
+    """
+    for i in range(1, len(word_list)):
+        item = word_list[i]
+        j = i - 1
+        while j >= 0 and word_list[j] > item:
+            word_list[j + 1] = word_list[j]
+            j -= 1
+        word_list[j + 1] = item
+
+def radix_sort_strings(string_list, cutoff=16):
+    """
+    This function sorts a list of strings (any unicode) or a list of bytes in normal
+    lexicographic order with an MSD radix sort. A group of words sharing the first d
+    characters is split into buckets by its (d+1)-th character, taken as the slice
+    word[d:d+1] so that a word ending at d falls in the '' (or b'') bucket, which
+    sorts before every character. The buckets are visited in character order with
+    an explicit stack, and a bucket with at most cutoff words is finished with
+    insertion sort; comparing whole words is correct there since they share their
+    first d characters. Words are never copied, only the references move.
+
+    :precondition: string_list must consist only str or only bytes, yet string_list
+    can be empty too.
+
+    :param string_list: list of strings or bytes to be sorted
+    :param cutoff: the largest bucket finished by insertion sort
+
+    :Best case: O(N) when the first characters already split the words into
+    buckets of at most cutoff words.
+
+    :Worst case: O(D + N log S) with D as the number of characters that have to be
+    looked at to tell the words apart (the distinguishing prefixes), N as the length
+    of string_list and S as the number of distinct characters, for sorting bucket keys.
+
+    :Aux space complexity: O(N) for the buckets and the stack.
+
+    :return word_list: sorted list in lexicographic order.
+    """
+    word_list = []
+    stack = [(list(string_list), 0)]
+
+    while stack:
+        group, d = stack.pop()
+
+        if len(group) <= cutoff:
+            insertion_sort(group)
+            word_list.extend(group)
+            continue
+
+        buckets = {}
+        for word in group:
+            char = word[d:d + 1]
+            bucket = buckets.get(char)
+            if bucket is None:
+                buckets[char] = [word]
+            else:
+                bucket.append(word)
+
+        # words equal to the common prefix come first and are already in place,
+        # the other buckets are pushed in reverse order so that the smallest
+        # character is popped first
+        finished = buckets.pop(group[0][:0], None)
+        if finished:
+            word_list.extend(finished)
+        for char in sorted(buckets, reverse=True):
+            stack.append((buckets[char], d + 1))
+
+    return word_list
+
+if __name__ == "__main__":
+    import random
+    import sys
+
+    # --calibrate [PATH] measures the thresholds and optionally saves them to PATH
+    if sys.argv[1:2] == ["--calibrate"]:
+        print(json.dumps(calibrate(sys.argv[2] if len(sys.argv) > 2 else None), indent=2))
+        sys.exit()
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    data = [random.getrandbits(32) for _ in range(n)]
+    print("sorting %d random 32-bit integers" % n)
+
+    start = time.perf_counter()
+    expected = sorted(data)
+    print("sorted():          %.2f s" % (time.perf_counter() - start))
+
+    for base in (2**8, 2**11, 2**16, 10, None):
+        start = time.perf_counter()
+        result = radix_sort(data, base)
+        print("radix_sort(b=%-5s) %.2f s" % (base, time.perf_counter() - start))
+        assert result == expected
+
+    if np is not None:
+        keys = np.array(data, dtype=np.int64)
+        start = time.perf_counter()
+        np.sort(keys)
+        print("np.sort():         %.2f s" % (time.perf_counter() - start))
+        start = time.perf_counter()
+        result = radix_sort_numpy(keys)
+        print("radix_sort_numpy:  %.2f s" % (time.perf_counter() - start))
+        assert result.tolist() == expected
+
+    words = ["".join(chr(random.randint(97, 122)) for _ in range(random.randint(3, 12))) for _ in range(n)]
+    start = time.perf_counter()
+    expected = sorted(words)
+    print("sorted(words):     %.2f s" % (time.perf_counter() - start))
+    start = time.perf_counter()
+    result = radix_sort_strings(words)
+    print("radix_sort_strings: %.2f s" % (time.perf_counter() - start))
+    assert result == expected
@@ -371,6 +371,127 @@ class SuffixArray:
 
         return to_return
 
+def build_suffix_array(text):
+    """
+    This function builds the suffix array of any string or bytes by prefix doubling.
+    SuffixTree only accepts lower case characters and traces the tree recursively,
+    so this is used for arbitrary (and multi-MB) input instead. On each round the
+    suffixes are sorted by the rank of their first k characters paired with the rank
+    of the k characters after that. Because the previous order is kept, the sort only
+    has to reorder suffixes that share a rank.
+    :param text: a string or bytes
+    :Best case: O(N log N) with N as the length of text when all characters are distinct
+    :Worst case: O(N log^2 N) with N as the length of text
+    :Aux space complexity: O(N)
+    :Space complexity: O(N)
+    :return suffix_arr: a list of starting positions of the suffixes in sorted order
+    """
+    n = len(text)
+    if n == 0:
+        return []
+
+    # Rank the characters as 0..sigma-1 so that a pair of ranks packs into one int
+    alphabet = {char: r for r, char in enumerate(sorted(set(text)))}
+    rank = [alphabet[char] for char in text]
+    suffix_arr = sorted(range(n), key=rank.__getitem__)
+
+    k = 1
+    while True:
+        # Pack (rank of the first k characters, rank of the next k characters) into one int
+        second = rank[k:] + [-1]*min(k, n)
+        keys = [first*(n + 1) + nxt + 1 for first, nxt in zip(rank, second)]
+        suffix_arr.sort(key=keys.__getitem__)
+
+        new_rank = [0]*n
+        current = 0
+        previous = keys[suffix_arr[0]]
+        for idx in suffix_arr:
+            if keys[idx] != previous:
+                current += 1
+                previous = keys[idx]
+            new_rank[idx] = current
+        rank = new_rank
+
+        if current == n - 1:
+            return suffix_arr
+        k <<= 1
+
+def build_lcp_array(text, suffix_arr):
+    """
+    This function computes the longest common prefix array with Kasai's algorithm.
+    lcp[r] is the length of the longest common prefix of the suffixes at rank r-1
+    and r in suffix_arr, and lcp[0] is 0.
+    :param text: a string or bytes
+    :param suffix_arr: the suffix array of text
+    :Best and worst case: O(N) with N as the length of text since the common length
+    decreases by at most 1 between consecutive text positions
+    :Aux space complexity: O(N)
+    :Space complexity: O(N)
+    :return lcp: the longest common prefix array
+    """
+    n = len(text)
+    rank = [0]*n
+    for r, idx in enumerate(suffix_arr):
+        rank[idx] = r
+
+    lcp = [0]*n
+    h = 0
+    for i in range(n):
+        r = rank[i]
+        if r == 0:
+            h = 0
+            continue
+        j = suffix_arr[r - 1]
+        while i + h < n and j + h < n and text[i + h] == text[j + h]:
+            h += 1
+        lcp[r] = h
+        if h > 0:
+            h -= 1
+    return lcp
+
+def previous_factors(suffix_arr, lcp):
+    """
+    This function finds, for every text position, the two candidates for its longest
+    previous factor: the closest suffix before it and after it in suffix_arr that starts
+    earlier in the text, together with the length they share. One of the two is always
+    the longest match with any earlier position.
+    :param suffix_arr: the suffix array of the text
+    :param lcp: the longest common prefix array of suffix_arr
+    :Best and worst case: O(N) with N as the length of the text since every rank is
+    pushed and popped once
+    :Aux space complexity: O(N)
+    :Space complexity: O(N)
+    :return: a tuple of four lists indexed by text position: previous source, its
+    length, next source and its length. A source is -1 when it does not exist
+    """
+    n = len(suffix_arr)
+    prev_src = [-1]*n
+    prev_len = [0]*n
+    next_src = [-1]*n
+    next_len = [0]*n
+
+    # Stack of (text position, lcp with the entry below), text positions increase upwards
+    stack = [(-1, 0)]
+    for r in range(n + 1):
+        if r < n:
+            pos = suffix_arr[r]
+            shared = lcp[r]
+        else:
+            pos = -1
+            shared = 0
+
+        while stack[-1][0] > pos:
+            top, left = stack.pop()
+            prev_src[top] = stack[-1][0]
+            prev_len[top] = left if stack[-1][0] >= 0 else 0
+            next_src[top] = pos
+            next_len[top] = shared if pos >= 0 else 0
+            shared = min(shared, left)
+
+        stack.append((pos, shared))
+
+    return prev_src, prev_len, next_src, next_len
+
 if __name__ == "__main__":
     text_one = open("text_one.txt","r")
     text_two = open("text_two.txt","r")
@@ -0,0 +1,196 @@
+"""
+@created 19 October 2026
+
+Bit-level reader and writer shared by the compression code. Bits are packed most
+significant bit first, so a code written with write(code, n) reads back with
+read(n) and a bit string such as the output of Elias.elias_num keeps its order.
+"""
+
+class BitWriter:
+    """
+    This class implements a bit writer. Pending bits are kept in an integer
+    accumulator and moved to a bytearray whenever a whole byte is ready.
+    """
+    def __init__(self):
+        """
+        Construction function that initialises instances of class BitWriter
+        """
+        self.buffer = bytearray()
+        self.acc = 0
+        self.bits = 0
+
+    def __len__(self):
+        """
+        A method to calculate the number of bits written so far.
+        :best and worst case: O(1)
+        :return: an integer indicating the number of bits written
+        """
+        return len(self.buffer)*8 + self.bits
+
+    def write(self, value, nbits):
+        """
+        A method to write the lowest nbits bits of value.
+        :param value: a non-negative integer smaller than 2^nbits
+        :param nbits: the number of bits to write
+        :best and worst case: O(nbits/8)
+        :aux space complexity: O(1)
+        """
+        acc = (self.acc << nbits) | value
+        bits = self.bits + nbits
+        while bits >= 8:
+            bits -= 8
+            self.buffer.append((acc >> bits) & 0xff)
+        self.acc = acc & ((1 << bits) - 1)
+        self.bits = bits
+
+    def write_bit(self, bit):
+        """
+        A method to write a single bit.
+        :param bit: 0 or 1
+        :best and worst case: O(1)
+        """
+        self.write(bit, 1)
+
+    def write_bits(self, bitstr):
+        """
+        A method to write a string of '0' and '1' characters.
+        :param bitstr: the bit string, e.g. the output of Elias.elias_num
+        :best and worst case: O(len(bitstr))
+        """
+        if bitstr:
+            self.write(int(bitstr, 2), len(bitstr))
+
+    def align(self):
+        """
+        A method to pad with 0 bits up to the next byte boundary.
+        :best and worst case: O(1)
+        """
+        if self.bits:
+            self.write(0, 8 - self.bits)
+
+    def write_bytes(self, data):
+        """
+        A method to write whole bytes. The writer is aligned first.
+        :param data: a bytes-like object
+        :best and worst case: O(len(data))
+        """
+        self.align()
+        self.buffer += data
+
+    def write_aligned(self, other):
+        """
+        A method to append every bit written to another BitWriter, starting at a byte
+        boundary. The whole bytes of other are copied at once and its pending bits are
+        written after them.
+        :param other: a BitWriter
+        :best and worst case: O(len(other) / 8)
+        """
+        self.align()
+        self.buffer += other.buffer
+        if other.bits:
+            self.write(other.acc, other.bits)
+
+    def getvalue(self):
+        """
+        A method to get the written bits as bytes, padded with 0 bits to a whole byte.
+        :best and worst case: O(N) with N as the number of bytes written
+        :return: the bytes written so far
+        """
+        if self.bits:
+            return bytes(self.buffer) + bytes([(self.acc << (8 - self.bits)) & 0xff])
+        return bytes(self.buffer)
+
+class BitReader:
+    """
+    This class implements a bit reader over a bytes-like object, reading in the
+    same order as BitWriter writes.
+    """
+    def __init__(self, buf, pos=0):
+        """
+        Construction function that initialises instances of class BitReader.
+        pos is the bit position to start reading from.
+        """
+        self.buf = buf
+        self.pos = pos
+        self.size = len(buf)*8
+
+    def bits_left(self):
+        """
+        A method to calculate the number of unread bits.
+        :best and worst case: O(1)
+        :return: the number of bits left in the buffer
+        """
+        return self.size - self.pos
+
+    def read_bit(self):
+        """
+        A method to read a single bit.
+        :best and worst case: O(1)
+        :return: 0 or 1
+        """
+        pos = self.pos
+        if pos >= self.size:
+            raise Exception("End of bit stream")
+        self.pos = pos + 1
+        return (self.buf[pos >> 3] >> (7 - (pos & 7))) & 1
+
+    def read(self, nbits):
+        """
+        A method to read nbits bits as an unsigned integer.
+        :param nbits: the number of bits to read
+        :best and worst case: O(nbits/8)
+        :return: the integer formed by the bits
+        """
+        if nbits == 0:
+            return 0
+        pos = self.pos
+        end = pos + nbits
+        if end > self.size:
+            raise Exception("End of bit stream")
+        first = pos >> 3
+        last = (end + 7) >> 3
+        chunk = int.from_bytes(self.buf[first:last], "big")
+        self.pos = end
+        return (chunk >> ((last << 3) - end)) & ((1 << nbits) - 1)
+
+    def read_unary(self):
+        """
+        A method to count the 0 bits before the next 1 bit, consuming both. The
+        search looks at a whole byte at a time.
+        :best case: O(1)
+        :worst case: O(z/8) with z as the number of 0 bits
+        :return zeros: the number of 0 bits read
+        """
+        pos = self.pos
+        zeros = 0
+        while pos < self.size:
+            offset = pos & 7
+            byte = (self.buf[pos >> 3] << offset) & 0xff
+            if byte:
+                lead = 8 - byte.bit_length()
+                self.pos = pos + lead + 1
+                return zeros + lead
+            zeros += 8 - offset
+            pos += 8 - offset
+        raise Exception("End of bit stream")
+
+    def align(self):
+        """
+        A method to skip the padding bits up to the next byte boundary.
+        :best and worst case: O(1)
+        """
+        self.pos = (self.pos + 7) & ~7
+
+    def read_bytes(self, count):
+        """
+        A method to read whole bytes. The reader is aligned first.
+        :param count: the number of bytes to read
+        :best and worst case: O(count)
+        :return: the bytes read
+        """
+        self.align()
+        start = self.pos >> 3
+        if start + count > len(self.buf):
+            raise Exception("End of bit stream")
+        self.pos += count*8
+        return bytes(self.buf[start:start + count])
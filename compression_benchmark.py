@@ -0,0 +1,242 @@
+"""
+@created 19 October 2026
+
+Benchmark harness for the compression code (huffman_encoding, LZSS_Encoder with
+LZZS_Decoder, compressor and Elias) next to the zlib, bz2 and lzma baselines.
+The corpus is generated from fixed seeds so results are comparable between runs:
+English-like text, log lines, random bytes and an integer sequence.
+
+Usage:
+    python compression_benchmark.py [--size BYTES] [--output results.json] [--codecs a,b]
+
+For every (corpus, codec) pair the JSON report holds the compression ratio, encode
+and decode speed in MB/s of raw data and the peak traced memory of a round trip.
+"""
+import argparse
+import bz2
+import json
+import lzma
+import platform
+import random
+import sys
+import time
+import tracemalloc
+import zlib
+from array import array
+
+import Elias
+from bitio import BitReader, BitWriter
+from compressor import compress, decompress
+from huffman_encoding import canonical_codes, decode_symbol, decode_table, huffman_code_lengths
+from LZSS_Encoder import encode_lzss
+from LZZS_Decoder import decode_lzss_bytes, pack_lzss
+
+WORDS = ["the", "of", "and", "to", "in", "is", "that", "for", "it", "as", "was", "with",
+         "be", "by", "on", "not", "this", "are", "or", "from", "at", "which", "but",
+         "have", "an", "they", "were", "their", "compression", "index", "suffix", "heap",
+         "radix", "graph", "vertex", "queue", "encoding", "window", "match", "token"]
+
+def english_text(size, seed=33):
+    """
+    A function to generate English-like text: sentences of Zipf distributed words.
+    :param size: the number of bytes to generate
+    :param seed: the random seed
+    :return: the text as bytes
+    """
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(len(WORDS))]
+    parts = []
+    length = 0
+    while length < size:
+        sentence = " ".join(rng.choices(WORDS, weights, k=rng.randint(5, 20)))
+        sentence = sentence[0].upper() + sentence[1:] + ". "
+        parts.append(sentence)
+        length += len(sentence)
+    return "".join(parts).encode()[:size]
+
+def log_lines(size, seed=34):
+    """
+    A function to generate web server style log lines.
+    :param size: the number of bytes to generate
+    :param seed: the random seed
+    :return: the log as bytes
+    """
+    rng = random.Random(seed)
+    paths = ["/", "/index.html", "/api/search", "/api/items", "/static/app.js", "/login"]
+    agents = ["Mozilla/5.0", "curl/8.4.0", "python-requests/2.31"]
+    parts = []
+    length = 0
+    timestamp = 1700000000
+    while length < size:
+        timestamp += rng.randint(0, 3)
+        line = "10.0.%d.%d - - [%d] \"GET %s HTTP/1.1\" %d %d \"%s\"\n" % (
+            rng.randint(0, 3), rng.randint(1, 254), timestamp, rng.choice(paths),
+            rng.choice([200, 200, 200, 304, 404, 500]), rng.randint(100, 50000),
+            rng.choice(agents))
+        parts.append(line)
+        length += len(line)
+    return "".join(parts).encode()[:size]
+
+def random_bytes(size, seed=35):
+    """
+    A function to generate incompressible bytes.
+    :param size: the number of bytes to generate
+    :param seed: the random seed
+    :return: random bytes
+    """
+    return random.Random(seed).randbytes(size)
+
+def integer_gaps(size, seed=36):
+    """
+    A function to generate a posting-list like integer sequence: geometric gaps
+    stored as native int64, so size bytes hold size // 8 integers.
+    :param size: the number of bytes of the int64 representation
+    :param seed: the random seed
+    :return: the integers as array('q') bytes
+    """
+    rng = random.Random(seed)
+    return array("q", (int(rng.expovariate(1 / 20)) + 1 for _ in range(size // 8))).tobytes()
+
+CORPUS = {
+    "english": english_text,
+    "logs": log_lines,
+    "random": random_bytes,
+    "integers": integer_gaps,
+}
+
+def huffman_pack(data):
+    """
+    A function to compress bytes with huffman coding only: the code length of each
+    of the 256 byte values as an Elias omega code, then the coded bytes.
+    :param data: the bytes to be compressed
+    :return: the compressed bytes
+    """
+    frequencies = [0]*256
+    for byte in data:
+        frequencies[byte] += 1
+    lengths = huffman_code_lengths(frequencies)
+    codes = canonical_codes(lengths)
+
+    writer = BitWriter()
+    Elias.write_elias(writer, len(data) + 1)
+    for length in lengths:
+        Elias.write_elias(writer, length + 1)
+    for byte in data:
+        writer.write(codes[byte], lengths[byte])
+    return writer.getvalue()
+
+def huffman_unpack(buf):
+    """
+    A function to decompress the output of huffman_pack.
+    :param buf: the compressed bytes
+    :return: the original bytes
+    """
+    reader = BitReader(buf)
+    size = Elias.read_elias(reader) - 1
+    table = decode_table([Elias.read_elias(reader) - 1 for _ in range(256)])
+    return bytes(decode_symbol(reader, table) for _ in range(size))
+
+def elias_pack(data):
+    """
+    A function to compress an int64 sequence with the bulk Elias omega codec.
+    :param data: positive integers as array('q') bytes
+    :return: the compressed bytes
+    """
+    return Elias.encode_many(array("q", data))
+
+def elias_unpack(buf):
+    """
+    A function to decompress the output of elias_pack.
+    :param buf: the compressed bytes
+    :return: the integers as array('q') bytes
+    """
+    return array("q", Elias.decode_many(buf)).tobytes()
+
+# name: (compress, decompress, corpora it applies to; None for all)
+CODECS = {
+    "huffman": (huffman_pack, huffman_unpack, None),
+    "lzss": (lambda data: pack_lzss(encode_lzss(data, 6)), decode_lzss_bytes, None),
+    "lzh1": (compress, decompress, None),
+    "elias": (elias_pack, elias_unpack, ("integers",)),
+    "zlib": (lambda data: zlib.compress(data, 6), zlib.decompress, None),
+    "bz2": (lambda data: bz2.compress(data, 9), bz2.decompress, None),
+    "lzma": (lambda data: lzma.compress(data, preset=6), lzma.decompress, None),
+}
+
+def measure(pack, unpack, data):
+    """
+    A function to time a round trip of one codec on one corpus. The peak memory is
+    taken from a second round trip since tracing allocations slows the code down.
+    :param pack: the compress function
+    :param unpack: the decompress function
+    :param data: the corpus
+    :return: a dict of the measurements
+    """
+    start = time.perf_counter()
+    packed = pack(data)
+    encode_time = time.perf_counter() - start
+    start = time.perf_counter()
+    unpacked = unpack(packed)
+    decode_time = time.perf_counter() - start
+    if unpacked != data:
+        raise Exception("Round trip failed")
+    del unpacked
+
+    tracemalloc.start()
+    unpack(pack(data))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    megabytes = len(data) / 1e6
+    return {
+        "input_bytes": len(data),
+        "output_bytes": len(packed),
+        "ratio": len(packed) / len(data) if data else 0.0,
+        "encode_mb_s": megabytes / encode_time if encode_time else 0.0,
+        "decode_mb_s": megabytes / decode_time if decode_time else 0.0,
+        "peak_memory_bytes": peak,
+    }
+
+def run(size, codecs=None):
+    """
+    A function to run every codec on every corpus it applies to.
+    :param size: the size in bytes of each corpus
+    :param codecs: an iterable of names in CODECS, None for all
+    :return report: a dict ready to be dumped as JSON
+    """
+    names = list(codecs) if codecs else list(CODECS)
+    # build the Elias lookup tables outside of the timed region
+    Elias.build_tables()
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus_size": size,
+        "results": [],
+    }
+    for corpus, generate in CORPUS.items():
+        data = generate(size)
+        for name in names:
+            pack, unpack, applies_to = CODECS[name]
+            if applies_to is not None and corpus not in applies_to:
+                continue
+            result = {"corpus": corpus, "codec": name}
+            result.update(measure(pack, unpack, data))
+            report["results"].append(result)
+            print("%-9s %-8s ratio %.3f  encode %8.2f MB/s  decode %8.2f MB/s"
+                  % (corpus, name, result["ratio"], result["encode_mb_s"], result["decode_mb_s"]),
+                  file=sys.stderr)
+    return report
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the compression codecs against zlib, bz2 and lzma")
+    parser.add_argument("--size", type=int, default=1 << 17, help="bytes per corpus")
+    parser.add_argument("--output", help="JSON file to write, stdout if omitted")
+    parser.add_argument("--codecs", help="comma separated codecs, all if omitted: " + ",".join(CODECS))
+    args = parser.parse_args()
+
+    report = run(args.size, args.codecs.split(",") if args.codecs else None)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
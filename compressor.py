@@ -0,0 +1,179 @@
+"""
+@created 19 October 2026
+
+Deflate-style block compressor built from the project's pieces: LZSS tokens from
+LZSS_Encoder, canonical huffman codes from huffman_encoding for literals and match
+lengths, Elias omega codes for offsets and code lengths, all written through bitio.
+
+Container layout (bits are MSB first):
+    magic "LZH1"
+    per block:
+        1 bit   last block flag
+        1 bit   stored flag
+        omega   raw length + 1
+        32 bits CRC-32 of the raw block
+        padding to a byte boundary
+        stored block:     the raw bytes
+        compressed block: omega(code length + 1) for each of the ALPHABET symbols,
+                          then huffman coded symbols up to END_OF_BLOCK; a length
+                          symbol is followed by omega(offset)
+        padding to a byte boundary
+"""
+import binascii
+import time
+
+from bitio import BitReader, BitWriter
+from Elias import read_elias, write_elias
+from huffman_encoding import canonical_codes, decode_symbol, decode_table, huffman_code_lengths
+from LZSS_Encoder import MIN_MATCH, encode_lzss
+from LZZS_Decoder import copy_match
+
+MAGIC = b"LZH1"
+BLOCK_SIZE = 1 << 16
+MAX_MATCH = 258
+
+# literal/length alphabet: 0-255 literals, 256 end of block, 257+ match lengths
+END_OF_BLOCK = 256
+LENGTH_BASE = 257
+ALPHABET = LENGTH_BASE + MAX_MATCH - MIN_MATCH + 1
+
+def compress_block(writer, block, last, level):
+    """
+    A function to write one block to writer, choosing the stored form when
+    huffman coding does not make the block smaller. Blocks start and end on a
+    byte boundary.
+    :param writer: a bitio.BitWriter
+    :param block: the raw bytes of the block
+    :param last: True if this is the last block of the stream
+    :param level: the LZSS_Encoder level
+    :return: None
+    """
+    tokens = encode_lzss(block, level)
+
+    frequencies = [0]*ALPHABET
+    frequencies[END_OF_BLOCK] = 1
+    for token in tokens:
+        if token[0] == 1:
+            frequencies[token[1]] += 1
+        else:
+            frequencies[LENGTH_BASE + token[2] - MIN_MATCH] += 1
+    lengths = huffman_code_lengths(frequencies)
+    codes = canonical_codes(lengths)
+
+    payload = BitWriter()
+    for length in lengths:
+        write_elias(payload, length + 1)
+    for token in tokens:
+        if token[0] == 1:
+            payload.write(codes[token[1]], lengths[token[1]])
+        else:
+            symbol = LENGTH_BASE + token[2] - MIN_MATCH
+            payload.write(codes[symbol], lengths[symbol])
+            write_elias(payload, token[1])
+    payload.write(codes[END_OF_BLOCK], lengths[END_OF_BLOCK])
+
+    stored = len(payload) >= len(block)*8
+    writer.write_bit(1 if last else 0)
+    writer.write_bit(1 if stored else 0)
+    write_elias(writer, len(block) + 1)
+    writer.write(binascii.crc32(block), 32)
+
+    if stored:
+        writer.write_bytes(block)
+    else:
+        writer.write_aligned(payload)
+    writer.align()
+
+def decompress_block(reader, out):
+    """
+    A function to read one block from reader and append it to out.
+    :param reader: a bitio.BitReader positioned at a block header
+    :param out: the bytearray receiving the decompressed data
+    :return last: True if this was the last block of the stream
+    """
+    last = reader.read_bit()
+    stored = reader.read_bit()
+    size = read_elias(reader) - 1
+    checksum = reader.read(32)
+    start = len(out)
+
+    if stored:
+        out += reader.read_bytes(size)
+    else:
+        reader.align()
+        lengths = [read_elias(reader) - 1 for _ in range(ALPHABET)]
+        table = decode_table(lengths)
+        while True:
+            symbol = decode_symbol(reader, table)
+            if symbol < END_OF_BLOCK:
+                out.append(symbol)
+            elif symbol == END_OF_BLOCK:
+                break
+            else:
+                length = symbol - LENGTH_BASE + MIN_MATCH
+                offset = read_elias(reader)
+                if len(out) - offset < start:
+                    raise Exception("Invalid back-reference")
+                pos = len(out)
+                out += bytes(length)
+                copy_match(out, pos, offset, length)
+
+    if len(out) - start != size or binascii.crc32(out[start:]) != checksum:
+        raise Exception("Block checksum mismatch")
+    return last
+
+def compress(data, level=6, block_size=BLOCK_SIZE):
+    """
+    A function to compress data into the LZH1 container.
+    :param data: a bytes-like object
+    :param level: the LZSS_Encoder level used for every block
+    :param block_size: the number of raw bytes per block
+    :return: the compressed bytes
+    """
+    data = bytes(data)
+    writer = BitWriter()
+    writer.write_bytes(MAGIC)
+
+    if not data:
+        compress_block(writer, b"", True, level)
+    for start in range(0, len(data), block_size):
+        block = data[start:start + block_size]
+        compress_block(writer, block, start + block_size >= len(data), level)
+
+    return writer.getvalue()
+
+def decompress(buf):
+    """
+    A function to decompress an LZH1 container produced by compress.
+    :param buf: a bytes-like object
+    :return: the decompressed bytes
+    """
+    if bytes(buf[:len(MAGIC)]) != MAGIC:
+        raise Exception("Not an LZH1 stream")
+    reader = BitReader(buf, len(MAGIC)*8)
+    out = bytearray()
+    while not decompress_block(reader, out):
+        reader.align()
+    return bytes(out)
+
+if __name__ == "__main__":
+    import zlib
+    from LZSS_Encoder import benchmark_corpus
+
+    corpus = benchmark_corpus()
+    size = len(corpus)
+    print("corpus: %d bytes" % size)
+    print("codec     ratio   compress MB/s  decompress MB/s")
+
+    for name, pack, unpack in (("lzh1", compress, decompress),
+                               ("zlib-6", lambda d: zlib.compress(d, 6), zlib.decompress),
+                               ("zlib-9", lambda d: zlib.compress(d, 9), zlib.decompress)):
+        start = time.perf_counter()
+        packed = pack(corpus)
+        pack_time = time.perf_counter() - start
+        start = time.perf_counter()
+        assert unpack(packed) == corpus
+        unpack_time = time.perf_counter() - start
+        print("%-8s  %.3f  %13.2f  %15.2f" % (name, len(packed) / size,
+                                             size / pack_time / 1e6,
+                                             size / unpack_time / 1e6))
@@ -0,0 +1,291 @@
+"""
+@created 19 October 2026
+
+Priority queues for worker threads and for asyncio tasks, both wrapping
+PriorityQueue.IndexedPriorityQueue so that update and remove stay O(log n).
+
+With a capacity, add waits (backpressure) while the queue is full; without one
+the underlying array doubles when it runs out of room. serve waits while the
+queue is empty. Waits take an optional timeout in seconds, after which an
+Exception is raised.
+"""
+import asyncio
+import threading
+
+from PriorityQueue import IndexedPriorityQueue
+
+def make_heap(capacity, max_key):
+    """
+    A function to create the heap behind a concurrent queue.
+    :param capacity: the largest number of elements, None for unbounded
+    :param max_key: the largest integer key, None for any hashable key
+    :return: an IndexedPriorityQueue
+    """
+    return IndexedPriorityQueue((capacity or 16) + 1, max_key)
+
+def make_room(heap, capacity):
+    """
+    A function to double the array of an unbounded heap when it is full.
+    :param heap: an IndexedPriorityQueue
+    :param capacity: the capacity of the queue, None for unbounded
+    :best case: O(1)
+    :worst case: O(N), amortized O(1) per add
+    :return: None
+    """
+    if capacity is None and len(heap) + 1 >= len(heap.array):
+        heap.array.extend([None]*len(heap.array))
+
+class ThreadSafePriorityQueue:
+    """
+    This class implements a priority queue shared by threads. Every method takes one
+    lock, and two conditions on that lock wake the threads waiting for an element
+    or for room.
+    """
+    def __init__(self, capacity=None, max_key=None):
+        """
+        Construction function that initialises instances of class ThreadSafePriorityQueue
+        :param capacity: the largest number of elements, None for unbounded
+        :param max_key: the largest integer key, None for any hashable key
+        """
+        self.capacity = capacity
+        self.heap = make_heap(capacity, max_key)
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+    def __len__(self):
+        with self.lock:
+            return len(self.heap)
+
+    def is_empty(self):
+        with self.lock:
+            return self.heap.is_empty()
+
+    def contains(self, key):
+        with self.lock:
+            return self.heap.contains(key)
+
+    def add(self, key, value, timeout=None):
+        """
+        A method to add key with value, waiting for room when the queue is full.
+        :param key: a key that is not in the queue
+        :param value: the value the queue is ordered by
+        :param timeout: the longest wait in seconds, None to wait forever
+        :best case: O(1)
+        :worst case: O(logN) with N as the number of elements, plus waiting
+        :return: None
+        """
+        with self.not_full:
+            if self.capacity is not None:
+                if not self.not_full.wait_for(lambda: len(self.heap) < self.capacity, timeout):
+                    raise Exception("Queue is full")
+            make_room(self.heap, self.capacity)
+            self.heap.add(key, value)
+            self.not_empty.notify()
+
+    def serve(self, timeout=None):
+        """
+        A method to remove and return the element with the minimum value, waiting for
+        one when the queue is empty.
+        :param timeout: the longest wait in seconds, None to wait forever
+        :best case: O(1)
+        :worst case: O(logN) with N as the number of elements, plus waiting
+        :return: a (key, value) tuple
+        """
+        with self.not_empty:
+            if not self.not_empty.wait_for(lambda: not self.heap.is_empty(), timeout):
+                raise Exception("Queue is empty")
+            to_return = self.heap.serve()
+            self.not_full.notify()
+            return to_return
+
+    def update(self, key, value):
+        """
+        A method to change the value of a key in the queue.
+        :param key: a key in the queue
+        :param value: the new value
+        :best case: O(1)
+        :worst case: O(logN) with N as the number of elements
+        :return: None
+        """
+        with self.lock:
+            self.heap.update(key, value)
+
+    def remove(self, key):
+        """
+        A method to remove a key from the queue wherever it is.
+        :param key: a key in the queue
+        :best case: O(1)
+        :worst case: O(logN) with N as the number of elements
+        :return: the removed (key, value) tuple
+        """
+        with self.lock:
+            to_return = self.heap.remove(key)
+            self.not_full.notify()
+            return to_return
+
+
+class AsyncPriorityQueue:
+    """
+    This class implements a priority queue for asyncio tasks of one event loop. add
+    and serve are coroutines that wait on asyncio conditions; update and contains
+    never wait and are plain methods.
+    """
+    def __init__(self, capacity=None, max_key=None):
+        """
+        Construction function that initialises instances of class AsyncPriorityQueue
+        :param capacity: the largest number of elements, None for unbounded
+        :param max_key: the largest integer key, None for any hashable key
+        """
+        self.capacity = capacity
+        self.heap = make_heap(capacity, max_key)
+        self.lock = asyncio.Lock()
+        self.not_empty = asyncio.Condition(self.lock)
+        self.not_full = asyncio.Condition(self.lock)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def is_empty(self):
+        return self.heap.is_empty()
+
+    def contains(self, key):
+        return self.heap.contains(key)
+
+    async def add(self, key, value, timeout=None):
+        """
+        A coroutine to add key with value, waiting for room when the queue is full.
+        :param key: a key that is not in the queue
+        :param value: the value the queue is ordered by
+        :param timeout: the longest wait in seconds, None to wait forever
+        :best case: O(1)
+        :worst case: O(logN) with N as the number of elements, plus waiting
+        :return: None
+        """
+        async with self.not_full:
+            if self.capacity is not None and len(self.heap) >= self.capacity:
+                try:
+                    await asyncio.wait_for(
+                        self.not_full.wait_for(lambda: len(self.heap) < self.capacity), timeout)
+                except asyncio.TimeoutError:
+                    raise Exception("Queue is full")
+            make_room(self.heap, self.capacity)
+            self.heap.add(key, value)
+            self.not_empty.notify()
+
+    async def serve(self, timeout=None):
+        """
+        A coroutine to remove and return the element with the minimum value, waiting
+        for one when the queue is empty.
+        :param timeout: the longest wait in seconds, None to wait forever
+        :best case: O(1)
+        :worst case: O(logN) with N as the number of elements, plus waiting
+        :return: a (key, value) tuple
+        """
+        async with self.not_empty:
+            if self.heap.is_empty():
+                try:
+                    await asyncio.wait_for(
+                        self.not_empty.wait_for(lambda: not self.heap.is_empty()), timeout)
+                except asyncio.TimeoutError:
+                    raise Exception("Queue is empty")
+            to_return = self.heap.serve()
+            self.not_full.notify()
+            return to_return
+
+    def update(self, key, value):
+        """
+        A method to change the value of a key in the queue.
+        :param key: a key in the queue
+        :param value: the new value
+        :best case: O(1)
+        :worst case: O(logN) with N as the number of elements
+        :return: None
+        """
+        self.heap.update(key, value)
+
+    async def remove(self, key):
+        """
+        A coroutine to remove a key from the queue wherever it is.
+        :param key: a key in the queue
+        :best case: O(1)
+        :worst case: O(logN) with N as the number of elements
+        :return: the removed (key, value) tuple
+        """
+        async with self.lock:
+            to_return = self.heap.remove(key)
+            self.not_full.notify()
+            return to_return
+
+
+def thread_benchmark(n, pairs, capacity):
+    """
+    A function to time n items going through a ThreadSafePriorityQueue from pairs
+    producer threads to pairs consumer threads.
+    :param n: the number of items
+    :param pairs: the number of producers and of consumers
+    :param capacity: the capacity of the queue, None for unbounded
+    :return: items per second
+    """
+    import time
+
+    queue = ThreadSafePriorityQueue(capacity)
+    share = n // pairs
+
+    def produce(first):
+        for key in range(first, first + share):
+            queue.add(key, (key*7919) % n)
+
+    def consume():
+        for _ in range(share):
+            queue.serve()
+
+    threads = [threading.Thread(target=produce, args=(p*share,)) for p in range(pairs)]
+    threads += [threading.Thread(target=consume) for _ in range(pairs)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return share*pairs / (time.perf_counter() - start)
+
+def async_benchmark(n, pairs, capacity):
+    """
+    A function to time n items going through an AsyncPriorityQueue from pairs
+    producer tasks to pairs consumer tasks.
+    :param n: the number of items
+    :param pairs: the number of producers and of consumers
+    :param capacity: the capacity of the queue, None for unbounded
+    :return: items per second
+    """
+    import time
+
+    share = n // pairs
+
+    async def main():
+        queue = AsyncPriorityQueue(capacity)
+
+        async def produce(first):
+            for key in range(first, first + share):
+                await queue.add(key, (key*7919) % n)
+
+        async def consume():
+            for _ in range(share):
+                await queue.serve()
+
+        await asyncio.gather(*[produce(p*share) for p in range(pairs)],
+                             *[consume() for _ in range(pairs)])
+
+    start = time.perf_counter()
+    asyncio.run(main())
+    return share*pairs / (time.perf_counter() - start)
+
+if __name__ == "__main__":
+    import sys
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for capacity in (None, 64):
+        for pairs in (1, 2, 4, 8):
+            print("capacity %-4s %d producers/%d consumers: threads %8.0f items/s, asyncio %8.0f items/s"
+                  % (capacity, pairs, pairs, thread_benchmark(n, pairs, capacity),
+                     async_benchmark(n, pairs, capacity)))
@@ -0,0 +1,186 @@
+"""
+@created 19 October 2026
+
+Bulk loading of edge lists into typed arrays. Text files hold one "u v w" edge per
+line, as read by kruskals.Graph; they are parsed in large chunks, each split once
+and converted column by column with array(typecode, map(int, ...)), so there is no
+Python loop or tuple per edge. Binary files can be memory-mapped and are ready to
+use without parsing.
+
+Binary layout (little-endian):
+    magic "EDG1"
+    header: vertex count, edge count (2 x uint64), weight typecode ("q" or "d"),
+            3 bytes of padding, so the columns start at byte 24
+    sources: edge count x int64
+    targets: edge count x int64
+    weights: edge count x int64 or float64
+"""
+import mmap
+import struct
+import sys
+from array import array
+
+MAGIC = b"EDG1"
+HEADER = struct.Struct("<2Qc3x")
+CHUNK_BYTES = 1 << 22
+
+def parse_chunk(chunk, sources, targets, weights):
+    """
+    A function to append the edges of a chunk of complete lines to the arrays.
+    :param chunk: bytes holding whole "u v w" lines
+    :param sources: array('q') receiving the sources
+    :param targets: array('q') receiving the targets
+    :param weights: array('q') or array('d') receiving the weights
+    :best and worst case: O(C) with C as the length of chunk
+    :return weights: the weights array, converted to array('d') once a weight is
+    not an integer
+    """
+    fields = chunk.split()
+    if len(fields) % 3:
+        raise Exception("Malformed edges file")
+    sources.extend(array("q", map(int, fields[0::3])))
+    targets.extend(array("q", map(int, fields[1::3])))
+    column = fields[2::3]
+    if weights.typecode == "q":
+        try:
+            weights.extend(array("q", map(int, column)))
+            return weights
+        except ValueError:
+            weights = array("d", weights)
+    weights.extend(array("d", map(float, column)))
+    return weights
+
+def read_edges_text(path, chunk_bytes=CHUNK_BYTES):
+    """
+    A function to parse a text edges file chunk_bytes at a time. A chunk is cut
+    after its last newline and the rest is carried over to the next one.
+    :param path: the edges file
+    :param chunk_bytes: the number of bytes read at a time
+    :best and worst case: O(S) with S as the size of the file
+    :aux space complexity: O(E + chunk_bytes) with E as the number of edges
+    :return: a tuple of (sources, targets, weights) arrays; weights is array('q') if
+    every weight is an integer and array('d') otherwise
+    """
+    sources = array("q")
+    targets = array("q")
+    weights = array("q")
+    rest = b""
+    with open(path, "rb") as file:
+        while True:
+            block = file.read(chunk_bytes)
+            if not block:
+                break
+            block = rest + block
+            cut = block.rfind(b"\n") + 1
+            rest = block[cut:]
+            weights = parse_chunk(block[:cut], sources, targets, weights)
+    if rest.strip():
+        weights = parse_chunk(rest, sources, targets, weights)
+    return sources, targets, weights
+
+def write_edges_binary(path, vertices_count, sources, targets, weights):
+    """
+    A function to write edge arrays in the binary format.
+    :param path: the output file
+    :param vertices_count: the number of vertices
+    :param sources: a sequence of edge sources
+    :param targets: a sequence of edge targets
+    :param weights: a sequence of integer (array('q')) or float weights
+    :best and worst case: O(E) with E as the number of edges
+    :return: None
+    """
+    if not len(sources) == len(targets) == len(weights):
+        raise Exception("Edge arrays differ in length")
+    typecode = weights.typecode if isinstance(weights, array) and weights.typecode == "q" else "d"
+    columns = [array("q", sources), array("q", targets), array(typecode, weights)]
+    if sys.byteorder == "big":
+        for column in columns:
+            column.byteswap()
+    with open(path, "wb") as file:
+        file.write(MAGIC)
+        file.write(HEADER.pack(vertices_count, len(sources), typecode.encode()))
+        for column in columns:
+            column.tofile(file)
+
+def read_edges_binary(path, use_mmap=True):
+    """
+    A function to load a binary edges file. With use_mmap the three columns are
+    memoryviews cast over a read-only mapping of the file, so loading takes constant
+    time and pages are read by the operating system on first access; the mapping
+    stays open as long as one of the views is referenced.
+    :param path: the binary edges file
+    :param use_mmap: False to read the file into arrays instead
+    :best and worst case: O(1) with use_mmap, O(E) otherwise
+    :return: a tuple of (vertex count, sources, targets, weights)
+    """
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise Exception("Not an EDG1 edges file")
+        vertices_count, edges, typecode = HEADER.unpack(file.read(HEADER.size))
+        typecode = typecode.decode()
+        start = len(MAGIC) + HEADER.size
+        if use_mmap and sys.byteorder == "little" and edges > 0:
+            view = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+            columns = [view[start + 8*edges*c:start + 8*edges*(c + 1)].cast(code)
+                       for c, code in enumerate(("q", "q", typecode))]
+            return vertices_count, columns[0], columns[1], columns[2]
+
+        columns = []
+        for code in ("q", "q", typecode):
+            column = array(code)
+            column.fromfile(file, edges)
+            if sys.byteorder == "big":
+                column.byteswap()
+            columns.append(column)
+        return vertices_count, columns[0], columns[1], columns[2]
+
+def read_edges(path, use_mmap=True):
+    """
+    A function to load an edges file in either format, told apart by the magic.
+    :param path: a text or binary edges file
+    :param use_mmap: whether binary files are memory-mapped
+    :return: a tuple of (vertex count, sources, targets, weights); the vertex count
+    is None for text files, which do not store it
+    """
+    with open(path, "rb") as file:
+        binary = file.read(len(MAGIC)) == MAGIC
+    if binary:
+        return read_edges_binary(path, use_mmap)
+    return (None,) + read_edges_text(path)
+
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+    import time
+
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    n = max(2, m // 10)
+    rng = random.Random(49)
+    with tempfile.TemporaryDirectory() as directory:
+        text_path = os.path.join(directory, "edges.txt")
+        binary_path = os.path.join(directory, "edges.edg")
+        with open(text_path, "w") as file:
+            for _ in range(m):
+                file.write("%d %d %d\n" % (rng.randrange(n), rng.randrange(n), rng.randint(1, 10**6)))
+
+        start = time.perf_counter()
+        expected = []
+        with open(text_path) as file:
+            for line in file:
+                u, v, w = line.split()
+                expected.append((int(u), int(v), int(w)))
+        print("line by line:    %.2f s" % (time.perf_counter() - start))
+
+        start = time.perf_counter()
+        sources, targets, weights = read_edges_text(text_path)
+        print("read_edges_text: %.2f s" % (time.perf_counter() - start))
+        assert list(zip(sources, targets, weights)) == expected
+
+        write_edges_binary(binary_path, n, sources, targets, weights)
+        for use_mmap in (True, False):
+            start = time.perf_counter()
+            _, sources, targets, weights = read_edges_binary(binary_path, use_mmap)
+            print("read_edges_binary(use_mmap=%s): %.4f s" % (use_mmap, time.perf_counter() - start))
+            assert sources.tolist() == [edge[0] for edge in expected]
+            del sources, targets, weights
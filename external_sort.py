@@ -0,0 +1,235 @@
+"""
+@created 19 October 2026
+
+External (out-of-core) sort for integer files larger than memory. The input is read
+in chunks that fit the memory budget, every chunk is sorted with RadixSort.radix_sort
+and written to a temporary run file, and the runs are merged with the project's
+PriorityQueue holding one key per run. All reads and writes are sequential and go
+through fixed size buffers.
+
+Files are either "binary" (native int64, as written by array('q').tofile) or "text"
+(one integer per line).
+"""
+import os
+import shutil
+from contextlib import ExitStack
+import tempfile
+from array import array
+
+from PriorityQueue import PriorityQueue
+from RadixSort import radix_sort
+
+# rough peak bytes per key while a chunk is sorted: the Python int, the two
+# radix_sort buffers and the digit list
+BYTES_PER_KEY = 100
+RADIX_BASE = 1 << 16
+
+def read_chunks(path, fmt, chunk_keys):
+    """
+    A generator that reads the input file chunk_keys keys at a time.
+    :param path: the input file
+    :param fmt: "binary" or "text"
+    :param chunk_keys: the number of keys per chunk (approximate for text)
+    :return: an iterator over lists of integers
+    """
+    if fmt == "binary":
+        with open(path, "rb") as file:
+            while True:
+                chunk = array("q")
+                try:
+                    chunk.fromfile(file, chunk_keys)
+                except EOFError:
+                    pass
+                if not chunk:
+                    return
+                yield chunk.tolist()
+    elif fmt == "text":
+        with open(path, "r") as file:
+            # readlines stops after about hint characters, allow ~12 per line
+            while True:
+                lines = file.readlines(chunk_keys*12)
+                if not lines:
+                    return
+                yield [int(line) for line in lines if line.strip()]
+    else:
+        raise Exception("Unknown format " + fmt)
+
+class RunReader:
+    """
+    This class implements a buffered sequential reader over one sorted run file.
+    """
+    def __init__(self, path, block_keys):
+        """
+        Construction function that initialises instances of class RunReader
+        """
+        self.file = open(path, "rb")
+        self.block_keys = block_keys
+        self.block = array("q")
+        self.pos = 0
+
+    def next(self):
+        """
+        A method to get the next key of the run, refilling the buffer when empty.
+        :return: the next key, or None when the run is exhausted
+        """
+        if self.pos == len(self.block):
+            self.block = array("q")
+            try:
+                self.block.fromfile(self.file, self.block_keys)
+            except EOFError:
+                pass
+            self.pos = 0
+            if not self.block:
+                self.file.close()
+                return None
+        key = self.block[self.pos]
+        self.pos += 1
+        return key
+
+    def close(self):
+        """
+        A method to close the run file, which may already be closed.
+        :return: None
+        """
+        self.file.close()
+
+class OutputWriter:
+    """
+    This class implements a buffered writer for the sorted output.
+    """
+    def __init__(self, path, fmt, block_keys):
+        """
+        Construction function that initialises instances of class OutputWriter
+        """
+        if fmt not in ("binary", "text"):
+            raise Exception("Unknown format " + fmt)
+        self.fmt = fmt
+        self.file = open(path, "wb" if fmt == "binary" else "w")
+        self.block_keys = block_keys
+        self.block = array("q")
+
+    def write(self, key):
+        """
+        A method to append one key.
+        :param key: the integer to write
+        :return: None
+        """
+        self.block.append(key)
+        if len(self.block) >= self.block_keys:
+            self.flush()
+
+    def flush(self):
+        """
+        A method to write the buffered keys to the file.
+        :return: None
+        """
+        if self.fmt == "binary":
+            self.block.tofile(self.file)
+        elif self.block:
+            self.file.write("\n".join(map(str, self.block)) + "\n")
+        self.block = array("q")
+
+    def close(self):
+        """
+        A method to flush the buffer and close the file.
+        :return: None
+        """
+        self.flush()
+        self.file.close()
+
+def external_sort(input_path, output_path, fmt="binary", memory_limit=64 << 20,
+                  disk_limit=None, tmp_dir=None, output_fmt=None):
+    """
+    A function to sort an integer file that may not fit in memory.
+
+    Phase 1 reads memory_limit // BYTES_PER_KEY keys at a time, sorts them with
+    radix_sort and writes them as a binary run to a temporary file. Phase 2 merges
+    the runs: a PriorityQueue of size k holds the smallest unread key of each of the
+    k runs, and each run is read through a buffer of an equal share of the memory
+    budget.
+
+    :param input_path: the file to sort
+    :param output_path: the file receiving the sorted keys
+    :param fmt: the input format, "binary" (native int64) or "text" (one per line)
+    :param memory_limit: the approximate peak memory budget in bytes
+    :param disk_limit: the largest total size of the run files in bytes, None for
+    no limit; an Exception is raised when it would be exceeded
+    :param tmp_dir: the directory for the run files, the system default if None
+    :param output_fmt: the output format, the input format if None
+    :best and worst case: O(N log k) with N as the number of keys and k as the
+    number of runs, plus O(N) for the radix sorts
+    :aux space complexity: O(memory_limit) memory and O(8N) temporary disk
+    :return: a tuple of (number of keys, number of runs)
+    """
+    output_fmt = output_fmt or fmt
+    chunk_keys = max(1024, memory_limit // BYTES_PER_KEY)
+
+    runs = []
+    run_bytes = 0
+    total = 0
+    run_dir = tempfile.mkdtemp(prefix="external_sort_", dir=tmp_dir)
+    # the files are closed by the stack, on errors too, before run_dir is removed
+    stack = ExitStack()
+    try:
+        #Phase 1 - Sorted runs
+        for chunk in read_chunks(input_path, fmt, chunk_keys):
+            chunk = radix_sort(chunk, RADIX_BASE)
+            total += len(chunk)
+            run_bytes += len(chunk)*8
+            if disk_limit is not None and run_bytes > disk_limit:
+                raise Exception("Temporary disk budget exceeded")
+            path = os.path.join(run_dir, "run%d.bin" % len(runs))
+            runs.append(path)
+            with open(path, "wb") as file:
+                array("q", chunk).tofile(file)
+
+        if not runs:
+            OutputWriter(output_path, output_fmt, 1).close()
+            return 0, 0
+
+        #Phase 2 - k-way merge with one heap entry (run index, key) per run
+        block_keys = max(256, memory_limit // (8*(len(runs) + 1)) // 4)
+        readers = []
+        for path in runs:
+            readers.append(RunReader(path, block_keys))
+            stack.callback(readers[-1].close)
+        writer = OutputWriter(output_path, output_fmt, block_keys)
+        stack.callback(writer.file.close)
+        heap = PriorityQueue(len(runs) + 1)
+        for idx, reader in enumerate(readers):
+            key = reader.next()
+            if key is not None:
+                heap.add(idx, key)
+
+        while not heap.is_empty():
+            idx, key = heap.serve()
+            writer.write(key)
+            key = readers[idx].next()
+            if key is not None:
+                heap.add(idx, key)
+        writer.close()
+        return total, len(runs)
+    finally:
+        stack.close()
+        shutil.rmtree(run_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "input.bin")
+        target = os.path.join(directory, "output.bin")
+        with open(source, "wb") as file:
+            array("q", (random.randint(-10**12, 10**12) for _ in range(n))).tofile(file)
+
+        start = time.perf_counter()
+        keys, runs = external_sort(source, target, memory_limit=16 << 20)
+        print("%d keys, %d runs: %.2f s" % (keys, runs, time.perf_counter() - start))
+
+        result = array("q")
+        with open(target, "rb") as file:
+            result.fromfile(file, n)
+        assert all(result[i] <= result[i + 1] for i in range(n - 1))
@@ -0,0 +1,543 @@
+"""
+@created 19 October 2026
+
+Interchangeable priority queue engines with the add / serve / update interface of
+PriorityQueue.IndexedPriorityQueue (key is e.g. a vertex ID, value its distance):
+    DaryHeap     a d-ary heap, shallower than a binary heap so rises are cheaper
+    PairingHeap  a pairing heap, with O(1) add and decrease-key
+    RadixHeap    a monotone radix heap for non-negative integer values that never
+                 go below the last served value, as in Dijkstra with integer weights
+Every engine holds each key at most once. make_queue builds one by name, and running
+this module replays recorded Dijkstra traces on all of them.
+"""
+from PriorityQueue import IndexedPriorityQueue
+
+class DaryHeap:
+    """
+    This class implements a d-ary Minimum Heap with a key-to-position map. Keys and
+    values are kept in two parallel lists and the heap starts at position 0.
+    """
+    def __init__(self, d=4):
+        """
+        Construction function that initialises instances of class DaryHeap
+        :param d: the number of children per node, at least 2
+        """
+        if d < 2:
+            raise Exception("A d-ary heap needs d of at least 2")
+        self.d = d
+        self.keys = []
+        self.values = []
+        self.position = {}
+
+    def is_empty(self):
+        """
+        A method that returns a boolean indicating whether the heap is empty or not
+        :best and worst case: O(1)
+        :return: True if the heap is empty and False if otherwise.
+        """
+        return not self.keys
+
+    def __len__(self):
+        """
+        A method to get the number of elements in the heap.
+        :best and worst case: O(1)
+        :return: an integer indicating the number of elements in the heap.
+        """
+        return len(self.keys)
+
+    def __contains__(self, key):
+        """
+        A method to check whether key is in the heap.
+        :param key: the key to look for
+        :best and worst case: O(1)
+        :return: True if key is in the heap and False if otherwise.
+        """
+        return key in self.position
+
+    def add(self, key, value):
+        """
+        A method to insert key with value.
+        :param key: a hashable key that is not in the heap
+        :param value: the value the heap is ordered by
+        :best case: O(1)
+        :worst case: O(log_d N) with N as the number of elements
+        """
+        if key in self.position:
+            raise Exception("Key is already in the queue")
+        self.keys.append(key)
+        self.values.append(value)
+        self.rise(len(self.keys) - 1, key, value)
+
+    def serve(self):
+        """
+        A method to remove and return the element with the minimum value.
+        :best case: O(1) when there is only 1 element
+        :worst case: O(d log_d N) with N as the number of elements
+        :return: a (key, value) tuple
+        """
+        if not self.keys:
+            raise Exception("Heap is empty")
+        key = self.keys[0]
+        value = self.values[0]
+        del self.position[key]
+        last_key = self.keys.pop()
+        last_value = self.values.pop()
+        if self.keys:
+            self.sink(0, last_key, last_value)
+        return key, value
+
+    def update(self, key, value):
+        """
+        A method to change the value of key, rising or sinking it.
+        :param key: a key in the heap
+        :param value: the new value
+        :best case: O(1)
+        :worst case: O(d log_d N) with N as the number of elements
+        """
+        k = self.position.get(key)
+        if k is None:
+            raise Exception("Key is not in the queue")
+        if value < self.values[k]:
+            self.rise(k, key, value)
+        else:
+            self.sink(k, key, value)
+
+    def rise(self, k, key, value):
+        """
+        A method to place key with value at hole k or above it, shifting larger
+        parents down.
+        :param k: the position of the hole
+        :param key: the key to place
+        :param value: its value
+        :best case: O(1)
+        :worst case: O(log_d N)
+        """
+        keys = self.keys
+        values = self.values
+        position = self.position
+        d = self.d
+        while k > 0:
+            parent = (k - 1)//d
+            if values[parent] <= value:
+                break
+            keys[k] = keys[parent]
+            values[k] = values[parent]
+            position[keys[k]] = k
+            k = parent
+        keys[k] = key
+        values[k] = value
+        position[key] = k
+
+    def sink(self, k, key, value):
+        """
+        A method to place key with value at hole k or below it, shifting the
+        smallest child up while it is smaller than value.
+        :param k: the position of the hole
+        :param key: the key to place
+        :param value: its value
+        :best case: O(d)
+        :worst case: O(d log_d N)
+        """
+        keys = self.keys
+        values = self.values
+        position = self.position
+        d = self.d
+        n = len(keys)
+        while True:
+            first = d*k + 1
+            if first >= n:
+                break
+            child = first
+            smallest = values[first]
+            for i in range(first + 1, min(first + d, n)):
+                if values[i] < smallest:
+                    child = i
+                    smallest = values[i]
+            if value <= smallest:
+                break
+            keys[k] = keys[child]
+            values[k] = smallest
+            position[keys[k]] = k
+            k = child
+        keys[k] = key
+        values[k] = value
+        position[key] = k
+
+
+class PairingNode:
+    """
+    A node of a pairing heap. prev is the parent for the leftmost child and the left
+    sibling for the others.
+    """
+    __slots__ = ("key", "value", "child", "sibling", "prev")
+
+    def __init__(self, key, value):
+        self.key = key
+        self.value = value
+        self.child = None
+        self.sibling = None
+        self.prev = None
+
+
+class PairingHeap:
+    """
+    This class implements a pairing heap: a heap-ordered multiway tree where add and
+    decrease-key meld a single tree into the root, and serve pairs up the children
+    of the root in two passes.
+    """
+    def __init__(self):
+        """
+        Construction function that initialises instances of class PairingHeap
+        """
+        self.root = None
+        self.nodes = {}
+
+    def is_empty(self):
+        """
+        A method that returns a boolean indicating whether the heap is empty or not
+        :best and worst case: O(1)
+        :return: True if the heap is empty and False if otherwise.
+        """
+        return self.root is None
+
+    def __len__(self):
+        """
+        A method to get the number of elements in the heap.
+        :best and worst case: O(1)
+        :return: an integer indicating the number of elements in the heap.
+        """
+        return len(self.nodes)
+
+    def __contains__(self, key):
+        """
+        A method to check whether key is in the heap.
+        :param key: the key to look for
+        :best and worst case: O(1)
+        :return: True if key is in the heap and False if otherwise.
+        """
+        return key in self.nodes
+
+    def meld(self, a, b):
+        """
+        A method to link two trees; the root with the larger value becomes the
+        leftmost child of the other.
+        :param a: the root of a tree (without siblings) or None
+        :param b: the root of a tree (without siblings) or None
+        :best and worst case: O(1)
+        :return: the root of the linked tree
+        """
+        if a is None:
+            return b
+        if b is None:
+            return a
+        if b.value < a.value:
+            a, b = b, a
+        b.prev = a
+        b.sibling = a.child
+        if a.child is not None:
+            a.child.prev = b
+        a.child = b
+        return a
+
+    def merge_pairs(self, first):
+        """
+        A method to combine a list of sibling trees: they are melded in pairs from
+        left to right, then the pairs are melded from right to left.
+        :param first: the leftmost tree of the sibling list, or None
+        :best and worst case: O(S) with S as the number of siblings
+        :return: the root of the combined tree
+        """
+        pairs = []
+        while first is not None:
+            a = first
+            b = a.sibling
+            first = b.sibling if b is not None else None
+            a.sibling = a.prev = None
+            if b is not None:
+                b.sibling = b.prev = None
+            pairs.append(self.meld(a, b))
+        root = None
+        while pairs:
+            root = self.meld(pairs.pop(), root)
+        return root
+
+    def cut(self, node):
+        """
+        A method to detach the subtree of node from its parent and siblings.
+        :param node: a node that is not the root
+        :best and worst case: O(1)
+        """
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = node.prev
+        node.prev = node.sibling = None
+
+    def add(self, key, value):
+        """
+        A method to insert key with value.
+        :param key: a hashable key that is not in the heap
+        :param value: the value the heap is ordered by
+        :best and worst case: O(1)
+        """
+        if key in self.nodes:
+            raise Exception("Key is already in the queue")
+        node = PairingNode(key, value)
+        self.nodes[key] = node
+        self.root = self.meld(self.root, node)
+
+    def serve(self):
+        """
+        A method to remove and return the element with the minimum value.
+        :best case: O(1) when the root has no children
+        :worst case: O(N), amortized O(log N) with N as the number of elements
+        :return: a (key, value) tuple
+        """
+        root = self.root
+        if root is None:
+            raise Exception("Heap is empty")
+        del self.nodes[root.key]
+        self.root = self.merge_pairs(root.child)
+        return root.key, root.value
+
+    def update(self, key, value):
+        """
+        A method to change the value of key. A decrease cuts the subtree of the node
+        and melds it into the root; an increase removes the node, melds its children
+        back and inserts it again.
+        :param key: a key in the heap
+        :param value: the new value
+        :best case: O(1) for a decrease
+        :worst case: amortized O(log N) for an increase
+        """
+        node = self.nodes.get(key)
+        if node is None:
+            raise Exception("Key is not in the queue")
+        if value < node.value:
+            node.value = value
+            if node is not self.root:
+                self.cut(node)
+                self.root = self.meld(self.root, node)
+        elif value > node.value:
+            if node is self.root:
+                self.root = self.merge_pairs(node.child)
+            else:
+                self.cut(node)
+                self.root = self.meld(self.root, self.merge_pairs(node.child))
+            node.child = None
+            node.value = value
+            self.root = self.meld(self.root, node)
+
+
+class RadixHeap:
+    """
+    This class implements a monotone radix heap. A value v is kept in bucket
+    bit_length(v ^ last), where last is the last served value, so bucket i holds the
+    values that first differ from last in bit i - 1. When bucket 0 is empty, the
+    first non-empty bucket is emptied into lower buckets around its minimum.
+    Values must be non-negative integers that are never smaller than last.
+    """
+    def __init__(self, bits=64):
+        """
+        Construction function that initialises instances of class RadixHeap
+        :param bits: the largest bit length of a value
+        """
+        self.buckets = [{} for _ in range(bits + 1)]
+        self.bucket_of = {}
+        self.last = 0
+
+    def is_empty(self):
+        """
+        A method that returns a boolean indicating whether the heap is empty or not
+        :best and worst case: O(1)
+        :return: True if the heap is empty and False if otherwise.
+        """
+        return not self.bucket_of
+
+    def __len__(self):
+        """
+        A method to get the number of elements in the heap.
+        :best and worst case: O(1)
+        :return: an integer indicating the number of elements in the heap.
+        """
+        return len(self.bucket_of)
+
+    def __contains__(self, key):
+        """
+        A method to check whether key is in the heap.
+        :param key: the key to look for
+        :best and worst case: O(1)
+        :return: True if key is in the heap and False if otherwise.
+        """
+        return key in self.bucket_of
+
+    def add(self, key, value):
+        """
+        A method to insert key with value.
+        :param key: a hashable key that is not in the heap
+        :param value: an integer not smaller than the last served value
+        :best and worst case: O(1)
+        """
+        if key in self.bucket_of:
+            raise Exception("Key is already in the queue")
+        if value < self.last:
+            raise Exception("Radix heap values must not go below the last served value")
+        bucket = (value ^ self.last).bit_length()
+        self.buckets[bucket][key] = value
+        self.bucket_of[key] = bucket
+
+    def serve(self):
+        """
+        A method to remove and return the element with the minimum value.
+        :best case: O(1) when bucket 0 is not empty
+        :worst case: O(N + B), amortized O(B) with B as the number of bits
+        :return: a (key, value) tuple
+        """
+        if not self.bucket_of:
+            raise Exception("Heap is empty")
+        buckets = self.buckets
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+            moved = buckets[i]
+            buckets[i] = {}
+            last = self.last = min(moved.values())
+            bucket_of = self.bucket_of
+            for key, value in moved.items():
+                bucket = (value ^ last).bit_length()
+                buckets[bucket][key] = value
+                bucket_of[key] = bucket
+        key, value = buckets[0].popitem()
+        del self.bucket_of[key]
+        return key, value
+
+    def update(self, key, value):
+        """
+        A method to change the value of key by moving it to the bucket of the new value.
+        :param key: a key in the heap
+        :param value: an integer not smaller than the last served value
+        :best and worst case: O(1)
+        """
+        bucket = self.bucket_of.get(key)
+        if bucket is None:
+            raise Exception("Key is not in the queue")
+        if value < self.last:
+            raise Exception("Radix heap values must not go below the last served value")
+        del self.buckets[bucket][key]
+        bucket = (value ^ self.last).bit_length()
+        self.buckets[bucket][key] = value
+        self.bucket_of[key] = bucket
+
+
+# name: function of the largest number of elements returning an empty queue
+ENGINES = {
+    "binary": lambda size: IndexedPriorityQueue(size + 1),
+    "4-ary": lambda size: DaryHeap(4),
+    "8-ary": lambda size: DaryHeap(8),
+    "pairing": lambda size: PairingHeap(),
+    "radix": lambda size: RadixHeap(),
+}
+
+def make_queue(engine, size):
+    """
+    A function to create an empty priority queue of one of the ENGINES.
+    :param engine: a name in ENGINES
+    :param size: the largest number of elements the queue will hold
+    :return: the queue
+    """
+    if engine not in ENGINES:
+        raise Exception("Unknown heap engine " + engine)
+    return ENGINES[engine](size)
+
+def dijkstra_trace(adjacency, source):
+    """
+    A function to record the queue operations of Dijkstra's algorithm: ("add", v, d),
+    ("update", v, d) for decrease-keys and ("serve",) for extractions.
+    :param adjacency: a list of lists of (target, integer weight) per vertex
+    :param source: the source vertex
+    :best and worst case: O((V + E) log V)
+    :return trace: the list of operations
+    """
+    distance = [None]*len(adjacency)
+    done = [False]*len(adjacency)
+    queue = IndexedPriorityQueue(len(adjacency) + 1, len(adjacency) - 1)
+    trace = [("add", source, 0)]
+    distance[source] = 0
+    queue.add(source, 0)
+    while not queue.is_empty():
+        u, dist = queue.serve()
+        trace.append(("serve",))
+        done[u] = True
+        for v, weight in adjacency[u]:
+            if done[v]:
+                continue
+            candidate = dist + weight
+            if distance[v] is None:
+                distance[v] = candidate
+                queue.add(v, candidate)
+                trace.append(("add", v, candidate))
+            elif candidate < distance[v]:
+                distance[v] = candidate
+                queue.update(v, candidate)
+                trace.append(("update", v, candidate))
+    return trace
+
+def replay(queue, trace):
+    """
+    A function to run a recorded trace on a queue.
+    :param queue: an empty queue of one of the ENGINES
+    :param trace: operations from dijkstra_trace
+    :return served: the list of served values, for checking engines against each other
+    """
+    add = queue.add
+    update = queue.update
+    serve = queue.serve
+    served = []
+    for operation in trace:
+        if operation[0] == "serve":
+            served.append(serve()[1])
+        elif operation[0] == "add":
+            add(operation[1], operation[2])
+        else:
+            update(operation[1], operation[2])
+    return served
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = random.Random(43)
+
+    # a road-like grid with short integer lengths, and a sparse random graph
+    # with heavy-tailed weights that causes many decrease-keys
+    side = int(n ** 0.5)
+    grid = [[] for _ in range(side*side)]
+    for v in range(side*side):
+        row, col = divmod(v, side)
+        for w in ((v + 1) if col + 1 < side else None, (v + side) if row + 1 < side else None):
+            if w is not None:
+                weight = rng.randint(1, 100)
+                grid[v].append((w, weight))
+                grid[w].append((v, weight))
+    sparse = [[] for _ in range(n)]
+    for v in range(n):
+        for _ in range(8):
+            sparse[v].append((rng.randrange(n), int(rng.paretovariate(1.2)*10)))
+
+    for name, graph in (("grid", grid), ("random", sparse)):
+        trace = dijkstra_trace(graph, 0)
+        updates = sum(1 for operation in trace if operation[0] == "update")
+        print("%s: %d operations, %d decrease-keys" % (name, len(trace), updates))
+        expected = None
+        for engine in ENGINES:
+            queue = make_queue(engine, len(graph))
+            start = time.perf_counter()
+            served = replay(queue, trace)
+            print("  %-8s %.2f s" % (engine, time.perf_counter() - start))
+            assert expected is None or served == expected
+            expected = served
@@ -6,6 +6,12 @@ Huffman encoding using heapify priotity queue
 """
 
 class min_heapify:
+    """
+    This class implements the Minimum Heap used to build huffman trees. Every entry is
+    a (key, value) tuple where key is a precomputed sort key, such as
+    HuffmanNode.sort_key(), so that every comparison is a single tuple/int compare.
+    Keys are expected to be distinct.
+    """
     def __init__(self, array):
         self.array = array
         self.counter = len(array) - 1
@@ -51,9 +57,8 @@ class min_heapify:
     def add(self, key, value):
         """
         A method to append an element, in the form of a tuple) to the queue.
-        :param key: a key of the value. In this case, key is vertex ID.
-        :param value: a value of the key. In this case, value is the distance to
-        reach vertex ID.
+        :param key: the sort key of the entry
+        :param value: the payload of the entry, e.g. a HuffmanNode
         :best case: O(1) when array is full.
         :worst case: O(logN) with N as the number of element(s) in the queue because
         each time an element is inserted, rise happens.
@@ -79,17 +84,8 @@ class min_heapify:
         :aux space complexity: O(1) since no additional space is required.
         :space complexity: O(1)
         """
-        while k > 1 and self.array[k][0] <= self.array[k//2][0]:
-            # Check if the key are the same, then check on length
-            if self.array[k][0] == self.array[k//2][0]:
-                # cek length dulu, klo value child lebih kecil, swap
-                if len(self.array[k][1]) < len(self.array[k//2][1]):
-                    self.swap(k, k // 2)
-                else:
-                    if self.array[k][1] < self.array[k // 2][1]:
-                        self.swap(k, k // 2)
-            else:
-                self.swap(k, k // 2)
+        while k > 1 and self.array[k][0] < self.array[k//2][0]:
+            self.swap(k, k // 2)
             k = k//2
 
     def serve(self):
@@ -127,13 +123,6 @@ class min_heapify:
             child = self.smallest_child(k)
             if self.array[k][0] < self.array[child][0]:
                 break
-                
-            else:
-                # cek if keys are the same then check value length, else swap 
-                if self.array[k][0] == self.array[child][0]:
-                    # kalo length val parent < length val child, break
-                    if len(self.array[k][1]) < len(self.array[child][1]):
-                        break
             self.swap(k, child)
             k = child
 
@@ -150,12 +139,6 @@ class min_heapify:
         if 2*k == self.counter or self.array[2*k][0] < self.array[2*k+1][0]:
             return 2*k
         else:
-            # if key is the same, compare by value
-            if self.array[2*k][0] == self.array[2*k+1][0]:
-                if len(self.array[2*k][1]) < len(self.array[2*k+1][1]):
-                    return 2 * k
-                if self.array[2*k][1] < self.array[2*k+1][1]:
-                    return 2*k
             return 2*k + 1
 
     def swap(self, i, j):
@@ -169,45 +152,45 @@ class min_heapify:
         """
         self.array[i], self.array[j] = self.array[j], self.array[i]
 
+def char_index(char):
+    """
+    A function to get the position of a character in the encoding list of
+    encode_huffman: printable ascii characters (32-127) at ord(char) - 31 and new
+    line (or any other control character) at 0.
+    :param char: a single character
+    :return: an index in range 0-96
+    """
+    return max(0, ord(char) - 31)
+
 def encode_huffman(arr):
     """
-    A function to generate huffman code
+    A function to generate huffman code. Every (key, value) item becomes a leaf
+    HuffmanNode for the character of value, the tree is built by huffman_tree_of
+    and the code of a character is read off the path to its leaf, 0 for the first
+    served (left) subtree and 1 for the second.
     :param arr: array containing of (key,value) items to be appended to heap
+    :best and worst case: O(NlogN) with N as the number of characters
     :return: an array of size 97 which contain the huffman encoding for each ascii char (idx + 31)
     """
-    min_heap = min_heapify(arr)
     encoding = [""]*97 # list for all possible ascii characters (32-127 + New line)
+    leaves = [HuffmanNode(key, char_index(val)) for key, val in arr[1:]]
+    root = huffman_tree_of(leaves)
+    if root is None:
+        return encoding
+
+    # a single character still needs a 1 bit code
+    if root.left is None:
+        encoding[root.min_symbol] = "0"
+        return encoding
 
-    while not min_heap.is_empty():
-        # serve twice
-        num_1, val_1 = min_heap.serve()
-        num_2, val_2 = min_heap.serve()
-
-        # iterate through chars in each serve to determine which one to prepend
-        for char in val_1:
-            idx = ord(char) - 31
-            # if idx < 0, it indicates new line and it will be placed at idx 0.
-            if idx < 0:
-                idx == 0
-            encoding[idx] = "0" + encoding[idx]
-
-        for char in val_2:
-            idx = ord(char) - 31
-            # if idx < 0, it indicates new line and it will be placed at idx 0.
-            if idx < 0:
-                idx == 0
-            encoding[idx] = "1" + encoding[idx]
-
-        # adding the serve results
-        new_key = num_1 + num_2
-        new_val = val_1 + val_2
-
-        # terminate if heap is empty
-        if min_heap.is_empty():
-            break
-
-        # appending new value to the heap for next encoding
-        min_heap.add(new_key, new_val)
+    stack = [(root, "")]
+    while stack:
+        node, code = stack.pop()
+        if node.left is None:
+            encoding[node.min_symbol] = code
+        else:
+            stack.append((node.left, code + "0"))
+            stack.append((node.right, code + "1"))
 
     return encoding
 
@@ -249,3 +232,157 @@ def encode(word):
         huffman_code = encoded[idx]
         
     return huffman_code
+
+class HuffmanNode:
+    """
+    A node of a huffman tree. A leaf holds one symbol and an internal node references
+    its two subtrees. The sort key (weight, size, min symbol) is computed once when
+    the node is made, so heap comparisons are integer tuple comparisons; subtrees
+    are disjoint, so no two nodes share a min symbol and the order is total.
+    """
+    __slots__ = ("weight", "size", "min_symbol", "left", "right")
+
+    def __init__(self, weight, symbol=None, left=None, right=None):
+        """
+        Construction function that initialises a leaf from weight and symbol, or an
+        internal node from left and right.
+        """
+        self.left = left
+        self.right = right
+        if left is None:
+            self.weight = weight
+            self.size = 1
+            self.min_symbol = symbol
+        else:
+            self.weight = left.weight + right.weight
+            self.size = left.size + right.size
+            self.min_symbol = min(left.min_symbol, right.min_symbol)
+
+    def sort_key(self):
+        """
+        A method to get the key the huffman heap is ordered by.
+        :return: a tuple of (weight, number of leaves, smallest symbol)
+        """
+        return self.weight, self.size, self.min_symbol
+
+def huffman_tree(frequencies):
+    """
+    A function to build the huffman tree of an integer alphabet with one leaf per
+    symbol that occurs (see huffman_tree_of).
+    :param frequencies: a list where frequencies[symbol] is the count of symbol
+    :best and worst case: O(NlogN) with N as the number of symbols that occur
+    :aux space complexity: O(N)
+    :return: the root HuffmanNode, None if no symbol occurs
+    """
+    return huffman_tree_of([HuffmanNode(frequencies[symbol], symbol)
+                            for symbol in range(len(frequencies)) if frequencies[symbol] > 0])
+
+def huffman_tree_of(leaves):
+    """
+    A function to build a huffman tree from leaf nodes. The leaves are heapified into
+    a min_heapify in O(N) keyed by HuffmanNode.sort_key, and the two lightest trees
+    are merged until one is left.
+    :param leaves: a list of leaf HuffmanNode with distinct symbols
+    :best and worst case: O(NlogN) with N as the number of leaves
+    :aux space complexity: O(N)
+    :return: the root HuffmanNode, None if there are no leaves
+    """
+    if not leaves:
+        return None
+    min_heap = min_heapify([None] + [(leaf.sort_key(), leaf) for leaf in leaves])
+    while len(min_heap) > 1:
+        _, left = min_heap.serve()
+        _, right = min_heap.serve()
+        node = HuffmanNode(0, left=left, right=right)
+        min_heap.add(node.sort_key(), node)
+    return min_heap.serve()[1]
+
+def huffman_code_lengths(frequencies):
+    """
+    A function to calculate the huffman code length of every symbol of an
+    arbitrary integer alphabet (e.g. bytes plus extra symbols) from the depth of
+    its leaf in huffman_tree.
+    :param frequencies: a list where frequencies[symbol] is the count of symbol
+    :best and worst case: O(NlogN) with N as the number of symbols that occur
+    :return lengths: a list where lengths[symbol] is the code length of symbol,
+    0 for symbols that do not occur
+    """
+    lengths = [0]*len(frequencies)
+    root = huffman_tree(frequencies)
+    if root is None:
+        return lengths
+
+    # a single symbol still needs a 1 bit code
+    if root.left is None:
+        lengths[root.min_symbol] = 1
+        return lengths
+
+    stack = [(root, 0)]
+    while stack:
+        node, depth = stack.pop()
+        if node.left is None:
+            lengths[node.min_symbol] = depth
+        else:
+            stack.append((node.left, depth + 1))
+            stack.append((node.right, depth + 1))
+    return lengths
+
+def canonical_codes(lengths):
+    """
+    A function to assign canonical huffman codes from code lengths. Symbols are
+    ordered by (length, symbol) and consecutive codes are given within a length,
+    so only the lengths have to be stored to rebuild the codes.
+    :param lengths: a list where lengths[symbol] is the code length of symbol
+    :return codes: a list where codes[symbol] is the code of symbol as an integer
+    """
+    codes = [0]*len(lengths)
+    code = 0
+    previous = 0
+    for length, symbol in sorted((lengths[s], s) for s in range(len(lengths)) if lengths[s] > 0):
+        code <<= length - previous
+        codes[symbol] = code
+        code += 1
+        previous = length
+    return codes
+
+def decode_table(lengths):
+    """
+    A function to build the table used by decode_symbol from code lengths.
+    :param lengths: a list where lengths[symbol] is the code length of symbol
+    :return: a tuple of (first code, first index, count) lists indexed by length
+    and the symbols sorted in canonical order
+    """
+    max_length = max(lengths) if lengths else 0
+    count = [0]*(max_length + 1)
+    for length in lengths:
+        if length > 0:
+            count[length] += 1
+
+    first_code = [0]*(max_length + 1)
+    first_index = [0]*(max_length + 1)
+    code = 0
+    index = 0
+    for length in range(1, max_length + 1):
+        code <<= 1
+        first_code[length] = code
+        first_index[length] = index
+        code += count[length]
+        index += count[length]
+
+    symbols = [s for _, s in sorted((lengths[s], s) for s in range(len(lengths)) if lengths[s] > 0)]
+    return first_code, first_index, count, symbols
+
+def decode_symbol(reader, table):
+    """
+    A function to read one canonical huffman coded symbol from a bitio.BitReader.
+    :param reader: a bitio.BitReader
+    :param table: the output of decode_table
+    :return: the decoded symbol
+    """
+    first_code, first_index, count, symbols = table
+    code = 0
+    for length in range(1, len(count)):
+        code = (code << 1) | reader.read_bit()
+        if code - first_code[length] < count[length]:
+            return symbols[first_index[length] + code - first_code[length]]
+    raise Exception("Invalid huffman code")
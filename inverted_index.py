@@ -0,0 +1,408 @@
+"""
+@created 19 October 2026
+
+Compressed inverted index. Each term's sorted document ids are stored as gaps,
+split into blocks of block_size postings. The code of a term's gaps is picked by
+universal_codes.choose_code on a sample of them: the Golomb and Rice codes fit the
+geometric gaps of frequent terms far better than Elias omega, which is kept (with
+the table driven Elias.encode_many) for the few terms it suits. For every block
+the index keeps its last document id and its byte offset (the skip pointers), so
+a query only decodes the blocks that can hold the documents it is looking for.
+
+File layout (integers are little-endian):
+    magic "INV1"
+    header: term count, block count, directory size, data size (4 x uint64)
+    directory: per term, varint length + utf-8 term, varint document count,
+               varint first block, varint block count, varint code (index
+               in universal_codes.CODES), varint code parameter (0 if the
+               code has none) (padded so that the skip arrays start at a
+               multiple of 8 bytes)
+    block_last:   block count x int64, last document id of each block
+    block_offset: (block count + 1) x int64, start of each block in the data
+    data: the coded blocks
+"""
+import heapq
+import mmap
+import struct
+import sys
+from array import array
+
+from Elias import decode_many, encode_many
+from LZZS_Decoder import read_varint, write_varint
+from universal_codes import CODES, choose_code
+from universal_codes import decode_many as decode_with
+from universal_codes import encode_many as encode_with
+
+MAGIC = b"INV1"
+HEADER = struct.Struct("<4Q")
+BLOCK_SIZE = 128
+SAMPLE_SIZE = 256
+CODE_NAMES = list(CODES)
+
+def choose_gap_code(gaps):
+    """
+    A function to pick the code of a term's gaps with universal_codes.choose_code,
+    measured on at most SAMPLE_SIZE gaps spread over the whole list.
+    :param gaps: a non-empty list of positive gaps
+    :best and worst case: O(S) with S as the sample size, for a fixed number of
+    candidate codes
+    :return: a tuple of (code name, parameter)
+    """
+    sample = gaps[::len(gaps) // SAMPLE_SIZE + 1]
+    code, param, _ = choose_code(sample)
+    return code, param
+
+def encode_gaps(gaps, code, param):
+    """
+    A function to code one block of gaps, with Elias.encode_many for omega and
+    universal_codes.encode_many otherwise.
+    :param gaps: a list of positive gaps
+    :param code: a name in universal_codes.CODES
+    :param param: the parameter of the code, None if it has none
+    :best and worst case: O(total code length)
+    :return: the coded block as bytes
+    """
+    if code == "omega":
+        return encode_many(gaps)
+    return encode_with(gaps, code, param)
+
+def decode_gaps(buf, code, param):
+    """
+    A function to decode a block written by encode_gaps.
+    :param buf: the coded block
+    :param code: the code the block was written with
+    :param param: the parameter the block was written with
+    :best and worst case: O(total code length)
+    :return: an iterator over the gaps
+    """
+    if code == "omega":
+        return decode_many(buf)
+    return decode_with(buf, code, param)
+
+def serialize_index(postings, block_size=BLOCK_SIZE):
+    """
+    A function to build the binary index from a mapping of term to document ids.
+    The first gap of a block is taken from the last document of the previous block
+    (or -1 for the first block) so that every gap is at least 1.
+    :param postings: a dict of term (str) to an iterable of distinct non-negative
+    document ids
+    :param block_size: the number of postings per block
+    :best and worst case: O(P log P) with P as the number of postings, for sorting
+    :aux space complexity: O(P)
+    :return: the index as bytes
+    """
+    directory = bytearray()
+    block_last = array("q")
+    block_offset = array("q")
+    data = bytearray()
+
+    for term in sorted(postings):
+        doc_ids = sorted(set(postings[term]))
+        encoded = term.encode("utf-8")
+        write_varint(directory, len(encoded))
+        directory += encoded
+        write_varint(directory, len(doc_ids))
+        write_varint(directory, len(block_last))
+        write_varint(directory, (len(doc_ids) + block_size - 1) // block_size)
+
+        gaps = [doc_ids[0] + 1]
+        gaps.extend(doc_ids[i] - doc_ids[i - 1] for i in range(1, len(doc_ids)))
+        code, param = choose_gap_code(gaps)
+        write_varint(directory, CODE_NAMES.index(code))
+        write_varint(directory, param or 0)
+
+        for start in range(0, len(doc_ids), block_size):
+            block_offset.append(len(data))
+            block_last.append(doc_ids[min(start + block_size, len(doc_ids)) - 1])
+            data += encode_gaps(gaps[start:start + block_size], code, param)
+
+    block_offset.append(len(data))
+    # pad so the skip arrays start 8-byte aligned in the file
+    directory += bytes(-(len(MAGIC) + HEADER.size + len(directory)) % 8)
+    if sys.byteorder == "big":
+        block_last.byteswap()
+        block_offset.byteswap()
+
+    return b"".join([MAGIC,
+                     HEADER.pack(len(postings), len(block_last), len(directory), len(data)),
+                     bytes(directory), block_last.tobytes(), block_offset.tobytes(), bytes(data)])
+
+def write_index(postings, path, block_size=BLOCK_SIZE):
+    """
+    A function to build the index and write it to path.
+    :param postings: a dict of term to an iterable of document ids
+    :param path: the output file
+    :param block_size: the number of postings per block
+    :return: None
+    """
+    with open(path, "wb") as file:
+        file.write(serialize_index(postings, block_size))
+
+class InvertedIndex:
+    """
+    This class implements a read-only view over a serialized index. Only the term
+    directory is parsed when it is opened; skip pointers are read in place from the
+    buffer and posting blocks are decoded on demand.
+    """
+    def __init__(self, buf):
+        """
+        Construction function that initialises instances of class InvertedIndex
+        from the bytes (or mmap) produced by serialize_index.
+        """
+        if bytes(buf[:len(MAGIC)]) != MAGIC:
+            raise Exception("Not an INV1 index")
+        self.buf = buf
+        self.file = None
+        term_count, block_count, dir_size, data_size = HEADER.unpack_from(buf, len(MAGIC))
+
+        pos = len(MAGIC) + HEADER.size
+        self.terms = {}
+        view = memoryview(buf)[pos:pos + dir_size]
+        cursor = 0
+        for _ in range(term_count):
+            length, cursor = read_varint(view, cursor)
+            term = bytes(view[cursor:cursor + length]).decode("utf-8")
+            cursor += length
+            doc_count, cursor = read_varint(view, cursor)
+            first_block, cursor = read_varint(view, cursor)
+            blocks, cursor = read_varint(view, cursor)
+            code, cursor = read_varint(view, cursor)
+            param, cursor = read_varint(view, cursor)
+            code = CODE_NAMES[code]
+            self.terms[term] = (doc_count, first_block, blocks, code,
+                                param if CODES[code][2] else None)
+        view.release()
+        pos += dir_size
+
+        skip_size = (2*block_count + 1)*8
+        self.views = []
+        if sys.byteorder == "little":
+            raw = memoryview(buf)[pos:pos + skip_size]
+            skips = raw.cast("q")
+            self.views = [raw, skips]
+        else:
+            skips = array("q", bytes(buf[pos:pos + skip_size]))
+            skips.byteswap()
+        self.block_last = skips[:block_count]
+        self.block_offset = skips[block_count:]
+        self.data_start = pos + skip_size
+
+    @classmethod
+    def open(cls, path, use_mmap=True):
+        """
+        A method to load an index file, memory-mapping it by default so that the
+        posting data is paged in by the operating system only when read.
+        :param path: the index file
+        :param use_mmap: False to read the whole file into memory instead
+        :return: an InvertedIndex
+        """
+        file = open(path, "rb")
+        if use_mmap:
+            index = cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+            index.file = file
+            return index
+        with file:
+            return cls(file.read())
+
+    @classmethod
+    def from_postings(cls, postings, block_size=BLOCK_SIZE):
+        """
+        A method to build an index in memory.
+        :param postings: a dict of term to an iterable of document ids
+        :param block_size: the number of postings per block
+        :return: an InvertedIndex
+        """
+        return cls(serialize_index(postings, block_size))
+
+    def close(self):
+        """
+        A method to release the skip pointer views and the mapped file.
+        :return: None
+        """
+        if self.views:
+            self.block_last.release()
+            self.block_offset.release()
+            for view in reversed(self.views):
+                view.release()
+            self.views = []
+        if self.file is not None:
+            self.buf.close()
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __contains__(self, term):
+        return term in self.terms
+
+    def __len__(self):
+        return len(self.terms)
+
+    def doc_count(self, term):
+        """
+        A method to get the number of documents containing term.
+        :param term: the term
+        :best and worst case: O(1)
+        :return: the document frequency, 0 for unknown terms
+        """
+        entry = self.terms.get(term)
+        return entry[0] if entry else 0
+
+    def decode_block(self, block, first, code, param):
+        """
+        A method to decode one block into document ids.
+        :param block: the global block number
+        :param first: the first block of the same term
+        :param code: the code of the term's gaps
+        :param param: the parameter of the code
+        :best and worst case: O(B) with B as the block size
+        :return doc_ids: the list of document ids in the block
+        """
+        start = self.data_start + self.block_offset[block]
+        end = self.data_start + self.block_offset[block + 1]
+        doc = self.block_last[block - 1] if block > first else -1
+        doc_ids = []
+        for gap in decode_gaps(self.buf[start:end], code, param):
+            doc += gap
+            doc_ids.append(doc)
+        return doc_ids
+
+    def postings(self, term):
+        """
+        A generator over all document ids of term in increasing order.
+        :param term: the term
+        :best and worst case: O(D) with D as the document frequency of term
+        :return: an iterator over document ids
+        """
+        entry = self.terms.get(term)
+        if entry is None:
+            return
+        _, first, blocks, code, param = entry
+        for block in range(first, first + blocks):
+            yield from self.decode_block(block, first, code, param)
+
+    def intersect(self, terms):
+        """
+        A method to evaluate an AND query. The rarest term gives the candidates and
+        every other term is probed through its skip pointers: blocks whose last
+        document is smaller than the candidate are skipped without being decoded.
+        :param terms: an iterable of terms
+        :best case: O(1) when a term is unknown
+        :worst case: O(D_min * T + decoded blocks * B) with D_min as the smallest
+        document frequency, T as the number of terms and B as the block size
+        :return result: the sorted list of documents containing every term
+        """
+        entries = []
+        for term in set(terms):
+            entry = self.terms.get(term)
+            if entry is None:
+                return []
+            entries.append(entry)
+        if not entries:
+            return []
+        entries.sort()
+
+        _, first, blocks, code, param = entries[0]
+        result = []
+        for block in range(first, first + blocks):
+            result.extend(self.decode_block(block, first, code, param))
+
+        block_last = self.block_last
+        for _, first, blocks, code, param in entries[1:]:
+            block = first
+            end = first + blocks
+            decoded_block = -1
+            decoded = None
+            idx = 0
+            kept = []
+            for doc in result:
+                # skip pointers: move to the first block that can contain doc
+                while block < end and block_last[block] < doc:
+                    block += 1
+                if block == end:
+                    break
+                if decoded_block != block:
+                    decoded = self.decode_block(block, first, code, param)
+                    decoded_block = block
+                    idx = 0
+                while decoded[idx] < doc:
+                    idx += 1
+                if decoded[idx] == doc:
+                    kept.append(doc)
+            result = kept
+            if not result:
+                break
+        return result
+
+    def union(self, terms):
+        """
+        A method to evaluate an OR query by merging the posting lists with a heap.
+        :param terms: an iterable of terms
+        :best and worst case: O(D log T) with D as the total document frequency and
+        T as the number of terms
+        :return result: the sorted list of documents containing any term
+        """
+        result = []
+        for doc in heapq.merge(*(self.postings(term) for term in set(terms))):
+            if not result or result[-1] != doc:
+                result.append(doc)
+        return result
+
+    def query(self, expression):
+        """
+        A method to evaluate a query of terms joined by AND and OR, where AND binds
+        tighter, e.g. "heap AND sort OR tree".
+        :param expression: the query string
+        :return: the sorted list of matching documents
+        """
+        clauses = []
+        for clause in expression.split(" OR "):
+            terms = [term for term in clause.split(" AND ") if term.strip()]
+            clauses.append(self.intersect(term.strip() for term in terms))
+        result = []
+        for doc in heapq.merge(*clauses):
+            if not result or result[-1] != doc:
+                result.append(doc)
+        return result
+
+if __name__ == "__main__":
+    import random
+    import time
+    import tracemalloc
+
+    rng = random.Random(32)
+    vocabulary = ["term%d" % i for i in range(2000)]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    postings = {term: set() for term in vocabulary}
+    for doc in range(100000):
+        for term in rng.choices(vocabulary, weights, k=20):
+            postings[term].add(doc)
+    postings = {term: sorted(docs) for term, docs in postings.items() if docs}
+
+    # tracemalloc only sees the new lists: the int objects they point to already
+    # exist in postings, so their size (ids above 256 are not cached) is added
+    tracemalloc.start()
+    raw = {term: list(docs) for term, docs in postings.items()}
+    raw_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del raw
+    raw_size += sum(sys.getsizeof(doc) for doc in set().union(*postings.values()))
+
+    start = time.perf_counter()
+    index = InvertedIndex.from_postings(postings)
+    build_time = time.perf_counter() - start
+    index_size = len(index.buf)
+    count = sum(len(docs) for docs in postings.values())
+    print("%d postings: python lists %d bytes, index %d bytes (%.1fx smaller, %.2f bits "
+          "per posting), built in %.2f s"
+          % (count, raw_size, index_size, raw_size / index_size, 8*index_size / count, build_time))
+
+    expected = sorted(set(postings["term0"]) & set(postings["term5"]) & set(postings["term500"]))
+    start = time.perf_counter()
+    assert index.intersect(["term0", "term5", "term500"]) == expected
+    print("term0 AND term5 AND term500: %d documents in %.4f s"
+          % (len(expected), time.perf_counter() - start))
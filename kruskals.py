@@ -4,6 +4,40 @@
 
 Kruskal's algorithm to find minimum weight spanning tree in a graph
 """
+import random
+from array import array
+
+from edge_io import read_edges
+from RadixSort import choose_base, radix_argsort
+
+# the largest set of edges filter_mst sorts without splitting it further
+FILTER_THRESHOLD = 1 << 12
+
+def parse_weight(text):
+    """
+    This function parses an edge weight, keeping integer weights as integers
+    :param text: the weight field of an edges file line
+    :return: an int, or a float if text is not an integer
+    """
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+def find_root(parent, a):
+    """
+    This function finds the root of a in an array-backed union-find, pointing every
+    visited node at its grandparent on the way (path halving)
+    :param parent: array('q') of parents, a root is its own parent
+    :param a: a vertex
+    :Best complexity: O(1) when a is a root
+    :Worse complexity: O(logN) with union by rank
+    :return a: the root of a
+    """
+    while parent[a] != a:
+        parent[a] = parent[parent[a]]
+        a = parent[a]
+    return a
 
 class Graph:
     """
@@ -20,12 +54,13 @@ class Graph:
         self.graph = []
 
         # Step 1 - Open edges_file
-        file = open(edges_file, "r")
+        with open(edges_file, "r") as file:
 
-        # Step 2 - Loop through each line in file and put it into graph
-        for line in file:
-           u, v, w = line.strip().split()
-           self.graph.append((u, v, w))
+            # Step 2 - Loop through each line in file and put it into graph
+            for line in file:
+                if line.strip():
+                    u, v, w = line.strip().split()
+                    self.graph.append((int(u), int(v), parse_weight(w)))
 
     def find(self, parent, a):
         """
@@ -42,7 +77,7 @@ class Graph:
         if parent[a] < 0:
             return a
         else:
-            parent[a] = self.find(parent[a])
+            parent[a] = self.find(parent, parent[a])
             return parent[a]
 
     def union(self, parent, a, b):
@@ -104,7 +139,7 @@ class Graph:
             parent.append(-1)
 
         # Step 3 - "tracing" the edges and performing union to find MST
-        while e < self.vertices_count - 1:
+        while e < self.vertices_count - 1 and i < len(self.graph):
             u, v, w = self.graph[i]
 
             a = self.find(parent, u)
@@ -122,3 +157,218 @@ class Graph:
 
         # Step 4 - return
         return to_write
+
+
+class ArrayGraph:
+    """
+    This class implements a Graph whose edges are kept in three parallel arrays
+    (sources, targets and weights) instead of a list of tuples, with an array-backed
+    union-find to calculate the minimum spanning tree using Kruskal's algorithm.
+    """
+    def __init__(self, vertices_count, sources, targets, weights):
+        """
+        Construction function that initialises instances of class ArrayGraph.
+        :param vertices_count: the number of vertices, numbered 0 to N-1
+        :param sources: array('q') of edge sources
+        :param targets: array('q') of edge targets
+        :param weights: array('q') of integer or array('d') of float edge weights
+        """
+        if not len(sources) == len(targets) == len(weights):
+            raise Exception("Edge arrays differ in length")
+        self.vertices_count = vertices_count
+        self.sources = sources
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_file(cls, vertices_count, edges_file, use_mmap=True):
+        """
+        A method to load a text ("u v w" lines) or binary edges file with
+        edge_io.read_edges. Text weights are stored in an array('q') when they are
+        all integers and in an array('d') otherwise; binary files are memory-mapped
+        unless use_mmap is False.
+        :param vertices_count: the number of vertices
+        :param edges_file: the path of the edges file
+        :param use_mmap: whether a binary file is memory-mapped
+        :return: an ArrayGraph
+        """
+        _, sources, targets, weights = read_edges(edges_file, use_mmap)
+        return cls(vertices_count, sources, targets, weights)
+
+    def edge_order(self, mode="sort", scale=None):
+        """
+        This function gives the edge indices sorted by weight. "sort" uses sorted()
+        with the bound __getitem__ of the weights array as key instead of a lambda per
+        edge. "radix" uses the stable RadixSort.radix_argsort on integer weights, or on
+        round(w * scale) for fixed-point weights, with the base from choose_base.
+        :param mode: "sort" or "radix"
+        :param scale: the multiplier turning fixed-point weights into integers, None
+        when the weights are integers
+        :Best and worst complexity: O(ElogE) for "sort" and O(M(E+b)) for "radix",
+        with E as the number of edges and M passes of base b
+        :return: a list of edge indices in non-decreasing order of weight
+        """
+        weights = self.weights
+        if mode == "sort":
+            return sorted(range(len(weights)), key=weights.__getitem__)
+        if mode != "radix":
+            raise Exception("Unknown edge order mode " + mode)
+        code = weights.typecode if isinstance(weights, array) else weights.format
+        if scale is not None:
+            keys = [round(w*scale) for w in weights]
+        elif code == "q":
+            keys = weights
+        else:
+            raise Exception("Radix mode needs integer weights or a scale")
+        if len(keys) == 0:
+            return []
+        return radix_argsort(keys, choose_base(len(keys), max(keys) - min(keys)))
+
+    def scan_edges(self, order, parent, rank, to_write):
+        """
+        This function is the union-find scan of Kruskal's algorithm: it goes through
+        the edges in order and takes every edge joining two components. find is
+        iterative with path halving (every visited node is pointed at its grandparent)
+        and union is by rank. The scan stops once N-1 edges are taken.
+        :param order: edge indices in non-decreasing order of weight
+        :param parent: array('q') of parents, a root is its own parent
+        :param rank: bytearray of the ranks of the roots
+        :param to_write: the MST weight followed by the edges taken so far, extended
+        in place
+        :Best complexity: O(N) when the first N-1 edges are taken
+        :Worse complexity: O(E a(N)) with a as the inverse Ackermann function
+        :return: None
+        """
+        sources = self.sources
+        targets = self.targets
+        weights = self.weights
+        mst_weight = to_write[0]
+        remaining = self.vertices_count - len(to_write)
+
+        for i in order:
+            if remaining <= 0:
+                break
+            a = sources[i]
+            while parent[a] != a:
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+            b = targets[i]
+            while parent[b] != b:
+                parent[b] = parent[parent[b]]
+                b = parent[b]
+            if a == b:
+                continue
+
+            if rank[a] < rank[b]:
+                parent[a] = b
+            elif rank[a] > rank[b]:
+                parent[b] = a
+            else:
+                parent[b] = a
+                rank[a] += 1
+
+            to_write.append((sources[i], targets[i], weights[i]))
+            mst_weight += weights[i]
+            remaining -= 1
+
+        to_write[0] = mst_weight
+
+    def find_mst(self, order=None, mode="sort", scale=None):
+        """
+        This function implements Kruskal's algorithm over the edge arrays, with an
+        array('q') of parents and a bytearray of ranks as the union-find.
+        :param order: the edge indices in non-decreasing order of weight, computed by
+        edge_order(mode, scale) if None
+        :param mode: "sort" or "radix" for edge_order, or "filter" for filter_mst
+        :param scale: the fixed-point multiplier of the "radix" mode
+        :Best complexity: O(ElogE) for the sort, the scan stopping after N-1 edges
+        :Worse complexity: O(ElogE + E a(N)) with a as the inverse Ackermann function
+        :Aux space complexity: O(N + E)
+        :return to_write: an array consisting of MST weight and the edge(s) creating
+        the MST, as Graph.find_mst
+        """
+        if order is None and mode == "filter":
+            return self.filter_mst()
+        if order is None:
+            order = self.edge_order(mode, scale)
+        to_write = [0]
+        self.scan_edges(order, array("q", range(self.vertices_count)),
+                        bytearray(self.vertices_count), to_write)
+        return to_write
+
+    def filter_mst(self, threshold=FILTER_THRESHOLD, seed=50):
+        """
+        This function implements Filter-Kruskal. A set of edges larger than threshold
+        is split around the weight of a random pivot edge; the light part is solved
+        first, then the heavy part is filtered, dropping the edges whose endpoints are
+        already in one component, before it is solved. Small sets are sorted and
+        scanned. On dense graphs most heavy edges are filtered out without being sorted.
+        :param threshold: the largest set of edges that is sorted directly
+        :param seed: the seed of the pivot choice
+        :Best complexity: O(E + NlogN) when the light edges span the graph early
+        :Worse complexity: O(ElogE) expected
+        :Aux space complexity: O(N + E)
+        :return to_write: an array consisting of MST weight and the edge(s) creating
+        the MST, as Graph.find_mst
+        """
+        rng = random.Random(seed)
+        sources = self.sources
+        targets = self.targets
+        weights = self.weights
+        parent = array("q", range(self.vertices_count))
+        rank = bytearray(self.vertices_count)
+        to_write = [0]
+
+        # (edge indices, whether the edges must be filtered first), light sets on top
+        stack = [(list(range(len(weights))), False)]
+        while stack and len(to_write) < self.vertices_count:
+            edges, heavy = stack.pop()
+            if heavy:
+                edges = [i for i in edges
+                         if find_root(parent, sources[i]) != find_root(parent, targets[i])]
+            if len(edges) > threshold:
+                pivot = weights[edges[rng.randrange(len(edges))]]
+                light = [i for i in edges if weights[i] <= pivot]
+                if len(light) < len(edges):
+                    stack.append(([i for i in edges if weights[i] > pivot], True))
+                    stack.append((light, False))
+                    continue
+            edges.sort(key=weights.__getitem__)
+            self.scan_edges(edges, parent, rank, to_write)
+        return to_write
+
+if __name__ == "__main__":
+    import os
+    import sys
+    import tempfile
+    import time
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    m = 10*n
+    rng = random.Random(48)
+    sources = array("q", (rng.randrange(n) for _ in range(m)))
+    targets = array("q", (rng.randrange(n) for _ in range(m)))
+    weights = array("q", (rng.randint(1, 10**6) for _ in range(m)))
+
+    graph = ArrayGraph(n, sources, targets, weights)
+    tree = None
+    for mode in ("sort", "radix", "filter"):
+        start = time.perf_counter()
+        result = graph.find_mst(mode=mode)
+        print("ArrayGraph (%s), %d vertices, %d edges: %.2f s, weight %d"
+              % (mode, n, m, time.perf_counter() - start, result[0]))
+        assert tree is None or tree[0] == result[0]
+        tree = result
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "edges.txt")
+        with open(path, "w") as file:
+            for i in range(m):
+                file.write("%d %d %d\n" % (sources[i], targets[i], weights[i]))
+        start = time.perf_counter()
+        expected = Graph(n, path).find_mst()
+        print("Graph from file:      %.2f s, weight %d" % (time.perf_counter() - start, expected[0]))
+        start = time.perf_counter()
+        result = ArrayGraph.from_file(n, path).find_mst()
+        print("ArrayGraph from file: %.2f s, weight %d" % (time.perf_counter() - start, result[0]))
+        assert expected[0] == tree[0] == result[0]
@@ -0,0 +1,142 @@
+"""
+@created 19 October 2026
+
+Parallel LSD radix sort of 64-bit signed integers over shared memory. The keys live
+in two multiprocessing.shared_memory buffers that every worker maps; only digit
+histograms and offsets go through the process pool's pipes.
+
+Every pass has two parallel phases:
+    1. each worker counts the digits of its own slice of the source buffer
+    2. the parent turns the counts into a start offset per (worker, digit): all keys
+       with a smaller digit come first, then the keys with the same digit from
+       workers on the left; each worker then scatters its slice into the destination
+       buffer from those offsets, which keeps the sort stable
+The buffers swap roles after each pass, exactly like RadixSort.radix_sort.
+"""
+from array import array
+from multiprocessing import Pool, shared_memory
+
+from RadixSort import radix_sort
+
+# keys are sorted as key + OFFSET, which maps int64 onto 0..2^64-1 in order
+OFFSET = 1 << 63
+
+# buffers of the current worker process, filled by attach
+shared = {}
+
+def attach(names, n):
+    """
+    This function maps the shared buffers into a worker process.
+    :param names: the names of the two SharedMemory blocks
+    :param n: the number of keys
+    :return: None
+    """
+    shared["memory"] = [shared_memory.SharedMemory(name=name) for name in names]
+    shared["views"] = [memory.buf[:n*8].cast("q") for memory in shared["memory"]]
+
+def count_digits(task):
+    """
+    This function counts the digits of one slice of the source buffer (phase 1).
+    :param task: a tuple (source buffer index, start, end, shift, radix bits)
+    :Best and worst case: O(S + 2^r) with S as the slice length and r as radix bits
+    :return count: the list of digit counts
+    """
+    src, start, end, shift, bits = task
+    mask = (1 << bits) - 1
+    count = [0]*(1 << bits)
+    for key in shared["views"][src][start:end]:
+        count[((key + OFFSET) >> shift) & mask] += 1
+    return count
+
+def scatter(task):
+    """
+    This function moves one slice of the source buffer into the destination buffer
+    from precomputed digit offsets (phase 2). Slices of different workers write to
+    disjoint positions, so no locking is needed.
+    :param task: a tuple (source buffer index, start, end, shift, radix bits, offsets)
+    :Best and worst case: O(S) with S as the slice length
+    :return: None
+    """
+    src, start, end, shift, bits, offsets = task
+    mask = (1 << bits) - 1
+    dst = shared["views"][1 - src]
+    for key in shared["views"][src][start:end]:
+        digit = ((key + OFFSET) >> shift) & mask
+        dst[offsets[digit]] = key
+        offsets[digit] += 1
+
+def parallel_radix_sort(keys, workers=4, radix_bits=16, min_chunk=1 << 16):
+    """
+    This function sorts 64-bit signed integers with a parallel LSD radix sort over
+    shared memory and returns the same result as sorted(keys) as an array('q').
+    Only the bits in which the smallest and greatest key differ are sorted on, and
+    a pass is skipped when every key has the same digit.
+    :param keys: an iterable of integers in the int64 range (an array('q') is
+    copied into shared memory without conversion)
+    :param workers: the number of worker processes
+    :param radix_bits: bits per digit
+    :param min_chunk: the smallest slice worth a worker; short inputs fall back to
+    the serial RadixSort.radix_sort
+    :Best and worst case: O(M(N/P + P*2^r)) with M as the number of passes, N as the
+    number of keys, P as workers and r as radix_bits
+    :Aux space complexity: O(N + P*2^r) with N shared between the processes
+    :return: the sorted keys as array('q')
+    """
+    data = keys if isinstance(keys, array) and keys.typecode == "q" else array("q", keys)
+    n = len(data)
+    workers = max(1, min(workers, n // min_chunk))
+    if workers == 1:
+        return array("q", radix_sort(data, 1 << radix_bits))
+
+    used_bits = ((min(data) + OFFSET) ^ (max(data) + OFFSET)).bit_length()
+    bounds = [n*w // workers for w in range(workers + 1)]
+    memory = [shared_memory.SharedMemory(create=True, size=n*8) for _ in range(2)]
+    names = [block.name for block in memory]
+    try:
+        memory[0].buf[:n*8] = data.tobytes()
+        src = 0
+        with Pool(workers, initializer=attach, initargs=(names, n)) as pool:
+            for shift in range(0, used_bits, radix_bits):
+                slices = [(src, bounds[w], bounds[w + 1], shift, radix_bits) for w in range(workers)]
+                counts = pool.map(count_digits, slices)
+
+                # skip the pass when every key has the same digit
+                totals = [sum(column) for column in zip(*counts)]
+                if max(totals) == n:
+                    continue
+
+                # offsets[w][d] = keys with a smaller digit + keys with digit d left of w
+                offsets = [[0]*(1 << radix_bits) for _ in range(workers)]
+                position = 0
+                for digit in range(1 << radix_bits):
+                    for w in range(workers):
+                        offsets[w][digit] = position
+                        position += counts[w][digit]
+
+                pool.map(scatter, [slices[w] + (offsets[w],) for w in range(workers)])
+                src = 1 - src
+
+        result = array("q")
+        result.frombytes(bytes(memory[src].buf[:n*8]))
+        return result
+    finally:
+        for block in memory:
+            block.close()
+            block.unlink()
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    keys = array("q", (random.randint(-(1 << 63), (1 << 63) - 1) for _ in range(n)))
+
+    start = time.perf_counter()
+    expected = sorted(keys)
+    print("sorted():              %.2f s" % (time.perf_counter() - start))
+    for workers in (1, 2, 4):
+        start = time.perf_counter()
+        result = parallel_radix_sort(keys, workers)
+        print("parallel_radix_sort(%d): %.2f s" % (workers, time.perf_counter() - start))
+        assert result.tolist() == expected
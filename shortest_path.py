@@ -0,0 +1,296 @@
+"""
+@created 19 October 2026
+
+Dijkstra's shortest paths and Prim's minimum spanning tree on a compressed sparse row
+(CSR) graph. The edges of vertex u are targets[offsets[u]:offsets[u + 1]] with the
+matching weights, so the whole graph is three flat arrays instead of a list per vertex
+or a tuple per edge. Both algorithms keep an indexed queue keyed by vertex ID, so
+decrease-key is O(log V): PriorityQueue.IndexedPriorityQueue by default, or any of
+the heap_engines.ENGINES.
+
+Edges files are text, one "u v w" line per edge with vertex IDs 0 to V - 1 as read
+by kruskals.Graph, or the binary format of edge_io.
+"""
+from array import array
+
+from edge_io import read_edges
+from heap_engines import make_queue
+from PriorityQueue import IndexedPriorityQueue
+
+INFINITY = float("inf")
+
+class CSRGraph:
+    """
+    This class implements a weighted graph in compressed sparse row form.
+    """
+    def __init__(self, vertices_count, offsets, targets, weights):
+        """
+        Construction function that initialises instances of class CSRGraph
+        :param vertices_count: the number of vertices
+        :param offsets: array('q') of vertices_count + 1 edge offsets
+        :param targets: array('q') of edge targets grouped by source
+        :param weights: array('d') of edge weights in the same order
+        """
+        self.vertices_count = vertices_count
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_arrays(cls, vertices_count, sources, targets, weights, directed=False):
+        """
+        A method to build the graph from parallel edge arrays with a counting sort on
+        the source vertex. An undirected edge is stored in both directions.
+        :param vertices_count: the number of vertices
+        :param sources: a sequence of edge sources
+        :param targets: a sequence of edge targets
+        :param weights: a sequence of edge weights
+        :param directed: False to add every edge in both directions
+        :Best and worst case: O(V + E)
+        :Aux space complexity: O(V + E)
+        :return: a CSRGraph
+        """
+        if not len(sources) == len(targets) == len(weights):
+            raise Exception("Edge arrays differ in length")
+        for u, v in ((min(sources, default=0), max(sources, default=0)),
+                     (min(targets, default=0), max(targets, default=0))):
+            if u < 0 or v >= max(vertices_count, 1):
+                raise Exception("Vertex ID out of range")
+
+        count = [0]*(vertices_count + 1)
+        for u in sources:
+            count[u + 1] += 1
+        if not directed:
+            for v in targets:
+                count[v + 1] += 1
+        for u in range(vertices_count):
+            count[u + 1] += count[u]
+        offsets = array("q", count)
+
+        edges = count[vertices_count]
+        csr_targets = array("q", bytes(8*edges))
+        csr_weights = array("d", bytes(8*edges))
+        position = count
+        for i in range(len(sources)):
+            u = sources[i]
+            v = targets[i]
+            w = weights[i]
+            csr_targets[position[u]] = v
+            csr_weights[position[u]] = w
+            position[u] += 1
+            if not directed:
+                csr_targets[position[v]] = u
+                csr_weights[position[v]] = w
+                position[v] += 1
+        return cls(vertices_count, offsets, csr_targets, csr_weights)
+
+    @classmethod
+    def from_edges(cls, vertices_count, edges, directed=False):
+        """
+        A method to build the graph from (u, v, w) tuples.
+        :param vertices_count: the number of vertices
+        :param edges: an iterable of (u, v, w) tuples
+        :param directed: False to add every edge in both directions
+        :Best and worst case: O(V + E)
+        :return: a CSRGraph
+        """
+        sources = array("q")
+        targets = array("q")
+        weights = array("d")
+        for u, v, w in edges:
+            sources.append(u)
+            targets.append(v)
+            weights.append(w)
+        return cls.from_arrays(vertices_count, sources, targets, weights, directed)
+
+    @classmethod
+    def from_file(cls, vertices_count, edges_file, directed=False):
+        """
+        A method to build the graph from a text ("u v w" lines) or binary edges file,
+        loaded with edge_io.read_edges.
+        :param vertices_count: the number of vertices
+        :param edges_file: the path of the edges file
+        :param directed: False to add every edge in both directions
+        :Best and worst case: O(V + E)
+        :return: a CSRGraph
+        """
+        _, sources, targets, weights = read_edges(edges_file)
+        return cls.from_arrays(vertices_count, sources, targets, weights, directed)
+
+    def __len__(self):
+        return self.vertices_count
+
+    def edge_count(self):
+        """
+        A method to get the number of stored (directed) edges.
+        :return: the length of targets
+        """
+        return len(self.targets)
+
+    def neighbours(self, u):
+        """
+        A generator over the edges leaving u.
+        :param u: a vertex ID
+        :return: an iterator over (target, weight) tuples
+        """
+        for i in range(self.offsets[u], self.offsets[u + 1]):
+            yield self.targets[i], self.weights[i]
+
+def make_vertex_queue(engine, n):
+    """
+    A function to create the queue of a graph search over n vertices.
+    :param engine: None for an IndexedPriorityQueue with a list position map, or a
+    name in heap_engines.ENGINES other than "radix", which needs integer values while
+    the CSR weights are floats
+    :param n: the number of vertices
+    :return: an empty queue
+    """
+    if engine is None:
+        return IndexedPriorityQueue(n + 1, n - 1)
+    if engine == "radix":
+        raise Exception("The radix heap needs integer values but CSR weights are floats")
+    return make_queue(engine, n)
+
+def dijkstra(graph, sources, engine=None):
+    """
+    A function to find the shortest distance from the nearest of the sources to every
+    vertex. All sources start at distance 0, which gives multi-source shortest paths
+    in one run. Edge weights must be non-negative.
+    :param graph: a CSRGraph
+    :param sources: a vertex ID or an iterable of vertex IDs
+    :param engine: the queue engine, see make_vertex_queue; not "radix", which needs
+    integer values while the CSR weights are floats
+    :Best case: O(V) when no source has an edge
+    :Worst case: O((V + E) log V)
+    :Aux space complexity: O(V)
+    :return: a tuple of (distance, parent): distance is a list of floats, INFINITY for
+    unreachable vertices, and parent an array('q') of predecessors, -1 for sources and
+    unreachable vertices
+    """
+    n = graph.vertices_count
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weights
+    distance = [INFINITY]*n
+    parent = array("q", [-1])*n
+    done = bytearray(n)
+    queue = make_vertex_queue(engine, n)
+
+    for source in ([sources] if isinstance(sources, int) else sources):
+        if distance[source] != 0:
+            distance[source] = 0
+            queue.add(source, 0)
+
+    while not queue.is_empty():
+        u, dist = queue.serve()
+        done[u] = 1
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            if done[v]:
+                continue
+            candidate = dist + weights[i]
+            if candidate < distance[v]:
+                if distance[v] == INFINITY:
+                    queue.add(v, candidate)
+                else:
+                    queue.update(v, candidate)
+                distance[v] = candidate
+                parent[v] = u
+    return distance, parent
+
+def path_to(parent, target):
+    """
+    A function to rebuild the path ending at target from the parent array of dijkstra.
+    :param parent: the parent array returned by dijkstra
+    :param target: the last vertex of the path
+    :Best and worst case: O(P) with P as the number of vertices on the path
+    :return path: the list of vertices from the source to target
+    """
+    path = [target]
+    while parent[path[-1]] != -1:
+        path.append(parent[path[-1]])
+    path.reverse()
+    return path
+
+def prim(graph, engine=None):
+    """
+    A function that implements Prim's algorithm to find a minimum spanning tree, or a
+    minimum spanning forest when the graph is not connected: every vertex not reached
+    yet starts a new tree. The queue holds, for each vertex next to the tree, the
+    lightest edge joining it.
+    :param graph: an undirected CSRGraph
+    :param engine: the queue engine, see make_vertex_queue; not "radix", since the
+    edge weights served by Prim are not monotone
+    :Best case: O(V) when there are no edges
+    :Worst case: O((V + E) log V)
+    :Aux space complexity: O(V)
+    :return to_write: a list of the total weight followed by the (u, v, w) edges of
+    the tree, as kruskals.Graph.find_mst
+    """
+    n = graph.vertices_count
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weights
+    best = [INFINITY]*n
+    via = array("q", [-1])*n
+    done = bytearray(n)
+    queue = make_vertex_queue(engine, n)
+    to_write = []
+    mst_weight = 0
+
+    for root in range(n):
+        if done[root]:
+            continue
+        queue.add(root, 0)
+        while not queue.is_empty():
+            u, w = queue.serve()
+            done[u] = 1
+            if via[u] != -1:
+                to_write.append((via[u], u, w))
+                mst_weight += w
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                if done[v] or weights[i] >= best[v]:
+                    continue
+                if best[v] == INFINITY:
+                    queue.add(v, weights[i])
+                else:
+                    queue.update(v, weights[i])
+                best[v] = weights[i]
+                via[v] = u
+
+    to_write.insert(0, mst_weight)
+    return to_write
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    m = 5*n
+    rng = random.Random(46)
+    sources = array("q", (rng.randrange(n) for _ in range(m)))
+    targets = array("q", (rng.randrange(n) for _ in range(m)))
+    weights = array("d", (rng.randint(1, 1000) for _ in range(m)))
+
+    start = time.perf_counter()
+    graph = CSRGraph.from_arrays(n, sources, targets, weights)
+    print("CSR build, %d vertices, %d edges: %.2f s" % (n, m, time.perf_counter() - start))
+
+    expected = None
+    for engine in (None, "4-ary", "pairing"):
+        start = time.perf_counter()
+        distance, parent = dijkstra(graph, 0, engine)
+        print("dijkstra (%s): %.2f s, %d reachable" % (engine or "indexed", time.perf_counter() - start,
+                                                       sum(1 for d in distance if d != INFINITY)))
+        assert expected is None or distance == expected
+        expected = distance
+
+    start = time.perf_counter()
+    distance, parent = dijkstra(graph, range(0, n, n // 10))
+    print("dijkstra from 10 sources: %.2f s" % (time.perf_counter() - start))
+
+    start = time.perf_counter()
+    tree = prim(graph)
+    print("prim: %.2f s, weight %d, %d edges" % (time.perf_counter() - start, tree[0], len(tree) - 1))
@@ -0,0 +1,252 @@
+"""
+@created 19 October 2026
+
+A family of integer codes sharing the bitio reader and writer: Elias gamma, delta
+and omega (Elias.py), Golomb, Rice and LEB128 varints. choose_code measures every
+code on a sample and picks the smallest one for that distribution.
+
+Gamma, delta and omega code integers >= 1 while Golomb, Rice and varints code
+integers >= 0.
+"""
+from bitio import BitReader, BitWriter
+from Elias import read_elias, write_elias
+
+def write_gamma(writer, num):
+    """
+    This function writes the Elias gamma code of num: the bit length of num minus
+    one as 0 bits, followed by num in binary.
+    :param writer: a bitio.BitWriter
+    :param num: a positive integer
+    :best and worst case: O(log num)
+    :return: None
+    """
+    if num < 1:
+        raise Exception("Elias gamma needs a positive integer")
+    length = num.bit_length()
+    writer.write(num, 2*length - 1)
+
+def read_gamma(reader):
+    """
+    This function reads one Elias gamma code.
+    :param reader: a bitio.BitReader
+    :best and worst case: O(log num)
+    :return: the decoded integer
+    """
+    zeros = reader.read_unary()
+    return (1 << zeros) | reader.read(zeros)
+
+def write_delta(writer, num):
+    """
+    This function writes the Elias delta code of num: the gamma code of its bit
+    length, followed by num in binary without its leading 1 bit.
+    :param writer: a bitio.BitWriter
+    :param num: a positive integer
+    :best and worst case: O(log num)
+    :return: None
+    """
+    if num < 1:
+        raise Exception("Elias delta needs a positive integer")
+    length = num.bit_length()
+    write_gamma(writer, length)
+    writer.write(num ^ (1 << (length - 1)), length - 1)
+
+def read_delta(reader):
+    """
+    This function reads one Elias delta code.
+    :param reader: a bitio.BitReader
+    :best and worst case: O(log num)
+    :return: the decoded integer
+    """
+    length = read_gamma(reader)
+    return (1 << (length - 1)) | reader.read(length - 1)
+
+def write_golomb(writer, num, m):
+    """
+    This function writes the Golomb code of num with parameter m: num // m in unary
+    (0 bits closed by a 1 bit) followed by num % m in truncated binary.
+    :param writer: a bitio.BitWriter
+    :param num: a non-negative integer
+    :param m: a positive integer, ideally about 0.69 times the mean of the values
+    :best and worst case: O(num/m + log m)
+    :return: None
+    """
+    quotient, remainder = divmod(num, m)
+    writer.write(1, quotient + 1)
+    if m > 1:
+        bits = (m - 1).bit_length()
+        cutoff = (1 << bits) - m
+        if remainder < cutoff:
+            writer.write(remainder, bits - 1)
+        else:
+            writer.write(remainder + cutoff, bits)
+
+def read_golomb(reader, m):
+    """
+    This function reads one Golomb code with parameter m.
+    :param reader: a bitio.BitReader
+    :param m: the parameter the value was written with
+    :best and worst case: O(num/m + log m)
+    :return: the decoded integer
+    """
+    quotient = reader.read_unary()
+    remainder = 0
+    if m > 1:
+        bits = (m - 1).bit_length()
+        cutoff = (1 << bits) - m
+        remainder = reader.read(bits - 1)
+        if remainder >= cutoff:
+            remainder = ((remainder << 1) | reader.read_bit()) - cutoff
+    return quotient*m + remainder
+
+def write_rice(writer, num, k):
+    """
+    This function writes the Rice code of num, which is the Golomb code with
+    m = 2^k: num >> k in unary followed by the low k bits of num.
+    :param writer: a bitio.BitWriter
+    :param num: a non-negative integer
+    :param k: a non-negative integer
+    :best and worst case: O(num/2^k + k)
+    :return: None
+    """
+    writer.write(1, (num >> k) + 1)
+    writer.write(num & ((1 << k) - 1), k)
+
+def read_rice(reader, k):
+    """
+    This function reads one Rice code with parameter k.
+    :param reader: a bitio.BitReader
+    :param k: the parameter the value was written with
+    :best and worst case: O(num/2^k + k)
+    :return: the decoded integer
+    """
+    return (reader.read_unary() << k) | reader.read(k)
+
+def write_varint(writer, num):
+    """
+    This function writes num as an unsigned LEB128 varint, 7 bits per byte with the
+    high bit set on every byte but the last.
+    :param writer: a bitio.BitWriter
+    :param num: a non-negative integer
+    :best and worst case: O(log num)
+    :return: None
+    """
+    while num >= 0x80:
+        writer.write((num & 0x7f) | 0x80, 8)
+        num >>= 7
+    writer.write(num, 8)
+
+def read_varint(reader):
+    """
+    This function reads one LEB128 varint.
+    :param reader: a bitio.BitReader
+    :best and worst case: O(log num)
+    :return: the decoded integer
+    """
+    num = 0
+    shift = 0
+    while True:
+        byte = reader.read(8)
+        num |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return num
+        shift += 7
+
+# name: (writer function, reader function, takes a parameter, smallest value)
+CODES = {
+    "gamma": (write_gamma, read_gamma, False, 1),
+    "delta": (write_delta, read_delta, False, 1),
+    "omega": (write_elias, read_elias, False, 1),
+    "golomb": (write_golomb, read_golomb, True, 0),
+    "rice": (write_rice, read_rice, True, 0),
+    "varint": (write_varint, read_varint, False, 0),
+}
+
+def encode_many(ints, code, param=None):
+    """
+    This function encodes a sequence of integers with one of CODES. The buffer
+    starts with the number of integers as a varint.
+    :param ints: a sequence of integers in the domain of the code
+    :param code: a name in CODES
+    :param param: m for golomb, k for rice, unused otherwise
+    :best and worst case: O(total code length)
+    :return: the packed codes as bytes
+    """
+    write, _, takes_param, _ = CODES[code]
+    writer = BitWriter()
+    write_varint(writer, len(ints))
+    if takes_param:
+        for num in ints:
+            write(writer, num, param)
+    else:
+        for num in ints:
+            write(writer, num)
+    return writer.getvalue()
+
+def decode_many(buf, code, param=None):
+    """
+    A generator that decodes a buffer produced by encode_many with the same code.
+    :param buf: a bytes-like object
+    :param code: a name in CODES
+    :param param: the parameter the buffer was encoded with
+    :best and worst case: O(total code length)
+    :return: an iterator over the decoded integers
+    """
+    _, read, takes_param, _ = CODES[code]
+    reader = BitReader(buf)
+    for _ in range(read_varint(reader)):
+        yield read(reader, param) if takes_param else read(reader)
+
+def encoded_size(ints, code, param=None):
+    """
+    This function measures how many bits ints take with a code, without the
+    count header.
+    :param ints: a sequence of integers in the domain of the code
+    :param code: a name in CODES
+    :param param: m for golomb, k for rice, unused otherwise
+    :return: the size in bits
+    """
+    write, _, takes_param, _ = CODES[code]
+    writer = BitWriter()
+    for num in ints:
+        if takes_param:
+            write(writer, num, param)
+        else:
+            write(writer, num)
+    return len(writer)
+
+def candidate_params(code, sample):
+    """
+    This function lists the parameters worth trying for a code on a sample: the
+    Golomb m near 0.69 times the mean and the Rice k near log2 of that.
+    :param code: a name in CODES
+    :param sample: a non-empty sequence of integers
+    :return: a list of parameters, [None] for codes without one
+    """
+    if not CODES[code][2]:
+        return [None]
+    mean = sum(sample) / len(sample)
+    best_m = max(1, int(round(0.69*mean)))
+    if code == "golomb":
+        return sorted({max(1, best_m + d) for d in (-1, 0, 1)} | {max(1, best_m // 2), best_m*2})
+    best_k = max(0, best_m.bit_length() - 1)
+    return [k for k in range(best_k - 1, best_k + 3) if k >= 0]
+
+def choose_code(sample):
+    """
+    This function picks the code giving the smallest encoded size on sample.
+    Codes that cannot represent the smallest value of the sample are skipped.
+    :param sample: a non-empty sequence of non-negative integers
+    :return: a tuple of (code name, parameter, size in bits) of the smallest code
+    """
+    if not sample:
+        raise Exception("Sample is empty")
+    smallest = min(sample)
+    best = None
+    for code in CODES:
+        if smallest < CODES[code][3]:
+            continue
+        for param in candidate_params(code, sample):
+            size = encoded_size(sample, code, param)
+            if best is None or size < best[2]:
+                best = (code, param, size)
+    return best